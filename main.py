@@ -1,40 +1,70 @@
-from datetime import datetime, timezone, timedelta
+import asyncio
+import hashlib
+import json
+import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends, HTTPException, status, Request, File, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from redis.exceptions import RedisError
 
+from src.conf.config import settings
+from src.core.rate_limit import limiter
 from src.database.db import get_db, sessionmanager
+from src.jobs.cleanup import CLEANUP_INTERVAL_HOURS, cleanup_expired_tokens
 from src.routes.v1 import contacts, auth, users
+from src.database.redis import redis_client, redis_pool
 
+logger = logging.getLogger("uvicorn.error")
 scheduler = AsyncIOScheduler()
 
+ROOT_BODY = json.dumps({"message": "Contacts Application v1.0"}).encode()
+ROOT_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.sha256(ROOT_BODY).hexdigest()[:32]}"',
+}
 
-async def cleanup_expired_tokens():
-    async with sessionmanager.session() as db:
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(days=7)
-        stmt = text(
-            "DELETE FROM refresh_tokens "
-            "WHERE expires_at < :now OR "
-            "revoked_at IS NOT NULL AND revoked_at < :cutoff"
-        )
-        await db.execute(stmt, {"now": now, "cutoff": cutoff})
-        await db.commit()
-        print(f"Expired tokens cleaned up [{now.strftime('%Y-%m-%d %H:%M:%S')}].")
+HEALTHCHECK_CACHE_SECONDS = 1.0
+_last_healthcheck_ok = 0.0
+
+
+async def prewarm_redis(connections: int) -> None:
+    # concurrent pings each check out their own connection, opening the sockets
+    await asyncio.gather(*(redis_client.ping() for _ in range(connections)))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    scheduler.add_job(cleanup_expired_tokens, "interval", hours=1)
-    scheduler.start()
+    db_result, redis_result = await asyncio.gather(
+        sessionmanager.prewarm(settings.POOL_SIZE),
+        prewarm_redis(settings.REDIS_PREWARM_CONNECTIONS),
+        return_exceptions=True,
+    )
+    if isinstance(db_result, (SQLAlchemyError, OSError)):
+        logger.warning("Database pool prewarm failed: %s", db_result)
+    elif isinstance(db_result, BaseException):
+        raise db_result
+    if isinstance(redis_result, (RedisError, OSError)):
+        logger.warning("Redis pool prewarm failed: %s", redis_result)
+    elif isinstance(redis_result, BaseException):
+        raise redis_result
+    if settings.ENABLE_BACKGROUND_JOBS:
+        scheduler.add_job(
+            cleanup_expired_tokens, "interval", hours=CLEANUP_INTERVAL_HOURS
+        )
+        scheduler.start()
     yield
-    scheduler.shutdown()
+    if scheduler.running:
+        scheduler.shutdown()
+    await sessionmanager.dispose()
+    await redis_pool.disconnect()
 
 
 app = FastAPI(
@@ -43,6 +73,7 @@ app = FastAPI(
     description="Contacts Application API",
     version="1.0",
 )
+app.state.limiter = limiter
 
 
 @app.exception_handler(RateLimitExceeded)
@@ -55,8 +86,8 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=list(settings.CORS_ORIGINS),
+    allow_credentials="*" not in settings.CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -68,12 +99,18 @@ app.include_router(users.router, prefix="/api/v1")
 
 
 @app.get("/")
-def read_root(request: Request):
-    return {"message": "Contacts Application v1.0"}
+async def read_root(request: Request):
+    if request.headers.get("if-none-match") == ROOT_HEADERS["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=ROOT_HEADERS)
+    return Response(ROOT_BODY, media_type="application/json", headers=ROOT_HEADERS)
 
 
 @app.get("/api/healthchecker")
-async def healthchecker(db: AsyncSession = Depends(get_db)):
+async def healthchecker(response: Response, db: AsyncSession = Depends(get_db)):
+    global _last_healthcheck_ok
+    response.headers["Cache-Control"] = "no-store"
+    if time.monotonic() - _last_healthcheck_ok < HEALTHCHECK_CACHE_SECONDS:
+        return {"message": "Welcome to FastAPI!"}
     try:
         # Make request
         result = await db.execute(text("SELECT 1"))
@@ -83,9 +120,10 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database is not configured correctly",
             )
+        _last_healthcheck_ok = time.monotonic()
         return {"message": "Welcome to FastAPI!"}
-    except Exception as e:
-        print(e)
+    except Exception:
+        logger.exception("Healthcheck failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 from src.conf.config import settings
+from src.database.db import normalize_db_url
 from src.entity.models import Base
 
 # this is the Alembic Config object, which provides
@@ -24,7 +25,7 @@ if config.config_file_name is not None:
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
-config.set_main_option("sqlalchemy.url", settings.DB_URL)
+config.set_main_option("sqlalchemy.url", normalize_db_url(settings.DB_URL))
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
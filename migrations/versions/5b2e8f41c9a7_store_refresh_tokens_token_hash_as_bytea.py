@@ -0,0 +1,42 @@
+"""store refresh_tokens token_hash as bytea
+
+Revision ID: 5b2e8f41c9a7
+Revises: d07cbe9d673c
+Create Date: 2026-10-14 20:05:12.418236
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e8f41c9a7"
+down_revision: Union[str, None] = "d07cbe9d673c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        existing_type=sa.String(length=64),
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
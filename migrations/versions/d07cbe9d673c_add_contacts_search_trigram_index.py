@@ -0,0 +1,33 @@
+"""add contacts search trigram index
+
+Revision ID: d07cbe9d673c
+Revises: 74702dc13f65
+Create Date: 2026-10-14 15:48:10.265517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d07cbe9d673c"
+down_revision: Union[str, None] = "74702dc13f65"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_contacts_search_trgm ON contacts USING gin "
+        "((first_name || ' ' || last_name || ' ' || email || ' ' "
+        "|| coalesce(phone, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_contacts_search_trgm", table_name="contacts")
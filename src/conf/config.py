@@ -10,6 +10,8 @@ configuration using environment variables. It includes settings for:
 - Cloudinary integration.
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict, EmailStr
 
@@ -19,11 +21,29 @@ class Settings(BaseSettings):
 
     Attributes:
         DB_URL (str): The database connection URL.
+        POOL_SIZE (int): The number of connections kept open in the database pool.
+        MAX_OVERFLOW (int): The number of extra database connections allowed under load.
+        POOL_TIMEOUT (int): Seconds to wait for a free pooled connection.
+        DB_PGBOUNCER (bool): Whether DB_URL points at PgBouncer in transaction mode.
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Expiration time for access tokens in minutes.
         REFRESH_TOKEN_EXPIRE_DAYS (int): Expiration time for refresh tokens in days.
         ALGORITHM (str): The algorithm used for JWT encoding/decoding.
         SECRET_KEY (str): The secret key for JWT.
+        JWT_CACHE_TTL (int): Lifetime of cached decoded JWT payloads in seconds.
+        BCRYPT_ROUNDS (int): The bcrypt work factor for new password hashes.
         REDIS_URL (str): The Redis connection URL.
+        REDIS_MAX_CONNECTIONS (int): The number of connections in the Redis pool.
+        REDIS_POOL_TIMEOUT (int): Seconds to wait for a free Redis connection.
+        REDIS_PREWARM_CONNECTIONS (int): Redis connections opened at startup.
+        AUTH_LOCAL_CACHE_TTL (int): Seconds a process trusts its own copy of a
+            token's user before asking Redis again.
+        CONTACTS_CACHE_TTL (int): Lifetime of cached contact reads in seconds.
+        EMAIL_CONFIRMED_CACHE_TTL (int): Lifetime of cached email confirmation
+            flags in seconds.
+        CONTACTS_RATE_LIMIT (str): Rate limit of the contact list endpoint per
+            client address, in slowapi notation.
+        RATE_LIMIT_REDIS_TIMEOUT (float): Seconds a rate limit check waits on
+            Redis before falling back to per-process counters.
         MAIL_USERNAME (EmailStr): The email address used for sending emails.
         MAIL_PASSWORD (str): The password for the email account.
         MAIL_FROM (EmailStr): The sender's email address.
@@ -37,17 +57,33 @@ class Settings(BaseSettings):
         CLD_NAME (str): The Cloudinary account name.
         CLD_API_KEY (str): The Cloudinary API key.
         CLD_API_SECRET (str): The Cloudinary API secret.
+        ENABLE_BACKGROUND_JOBS (bool): Whether the web process runs the scheduler.
+        CORS_ORIGINS (tuple[str, ...]): Origins allowed to make cross-origin requests.
         model_config (ConfigDict): Pydantic configuration for environment variables.
     """
 
     DB_URL: str
+    POOL_SIZE: int = 20
+    MAX_OVERFLOW: int = 40
+    POOL_TIMEOUT: int = 10
+    DB_PGBOUNCER: bool = False
     # jwt
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str
     SECRET_KEY: str
+    JWT_CACHE_TTL: int = 10
+    BCRYPT_ROUNDS: int = 12
     # redis
     REDIS_URL: str = "redis://localhost"
+    REDIS_MAX_CONNECTIONS: int = 256
+    REDIS_POOL_TIMEOUT: int = 5
+    REDIS_PREWARM_CONNECTIONS: int = 10
+    AUTH_LOCAL_CACHE_TTL: int = 30
+    CONTACTS_CACHE_TTL: int = 60
+    EMAIL_CONFIRMED_CACHE_TTL: int = 86400
+    CONTACTS_RATE_LIMIT: str = "120/minute"
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.2
     # email
     MAIL_USERNAME: EmailStr
     MAIL_PASSWORD: str
@@ -63,13 +99,27 @@ class Settings(BaseSettings):
     CLD_NAME: str
     CLD_API_KEY: str
     CLD_API_SECRET: str
+    # background jobs
+    ENABLE_BACKGROUND_JOBS: bool = True
+    # cors
+    CORS_ORIGINS: tuple[str, ...] = ("*",)
 
     model_config = ConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Returns the application settings, parsing the environment only once.
+
+    Returns:
+        Settings: The cached settings instance.
+    """
+    return Settings()
+
+
+settings = get_settings()
 """
 Instance of the Settings class.
 
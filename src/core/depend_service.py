@@ -9,6 +9,7 @@ and database interactions.
 Functions:
     get_auth_service: Provides an instance of AuthService.
     get_user_service: Provides an instance of UserService.
+    get_contacts_service: Provides an instance of ContactsService.
     get_current_user: Retrieves the currently authenticated user.
     get_current_admin_user: Ensures the current user is an admin.
 """
@@ -18,8 +19,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.services.auth import AuthService, oauth2_scheme
+from src.services.contacts import ContactsService
 from src.services.user import UserService
-from src.entity.models import User, UserRole
+from src.entity.models import UserRole
+from src.schemas.user import CurrentUser
 
 
 def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
@@ -34,22 +37,40 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     return AuthService(db)
 
 
-def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+def get_user_service(
+    db: AsyncSession = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> UserService:
     """Provides an instance of UserService.
 
+    The AuthService is shared with any other dependency of the same request.
+
     Args:
         db (AsyncSession): The database session.
+        auth_service (AuthService): The authentication service.
 
     Returns:
         UserService: An instance of the UserService class.
     """
-    return UserService(db)
+    return UserService(db, auth_service)
+
+
+def get_contacts_service(db: AsyncSession = Depends(get_db)) -> ContactsService:
+    """Provides an instance of ContactsService.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        ContactsService: An instance of the ContactsService class.
+    """
+    return ContactsService(db)
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
-) -> User:
+) -> CurrentUser:
     """Retrieves the currently authenticated user.
 
     Args:
@@ -57,7 +78,7 @@ async def get_current_user(
         auth_service (AuthService): The authentication service.
 
     Returns:
-        User: The currently authenticated user.
+        CurrentUser: The currently authenticated user.
 
     Raises:
         HTTPException: If the token is invalid or the user is not authenticated.
@@ -65,14 +86,16 @@ async def get_current_user(
     return await auth_service.get_current_user(token)
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_admin_user(
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     """Ensures the current user is an admin.
 
     Args:
-        current_user (User): The currently authenticated user.
+        current_user (CurrentUser): The currently authenticated user.
 
     Returns:
-        User: The currently authenticated admin user.
+        CurrentUser: The currently authenticated admin user.
 
     Raises:
         HTTPException: If the current user is not an admin.
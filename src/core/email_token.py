@@ -14,7 +14,10 @@ from datetime import datetime, timedelta, timezone
 import jwt
 from fastapi import HTTPException, status
 
-from src.conf.config import settings
+from src.core.jwt_cache import decode_cached
+from src.core.jwt_encode import encode_token
+
+_EMAIL_TTL = timedelta(days=7)
 
 
 def create_email_token(data: dict) -> str:
@@ -28,9 +31,9 @@ def create_email_token(data: dict) -> str:
         str: A JWT token encoded with the provided data and expiration time.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(timezone.utc), "exp": expire})
-    token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    now = datetime.now(timezone.utc)
+    to_encode.update({"iat": now, "exp": now + _EMAIL_TTL})
+    token = encode_token(to_encode)
     return token
 
 
@@ -47,9 +50,7 @@ def get_email_from_token(token: str) -> str:
         HTTPException: If the token is invalid or cannot be decoded.
     """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_cached(token)
         email = payload["sub"]
         return email
     except jwt.PyJWTError as e:
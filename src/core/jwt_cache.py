@@ -0,0 +1,109 @@
+"""
+Cached decoding of JWT tokens.
+
+This module provides a small in-process cache for decoded JWT payloads so
+that repeated requests carrying the same token skip signature verification
+and JSON parsing. Entries are keyed by a truncated SHA-256 digest of the
+token and expire after `settings.JWT_CACHE_TTL` seconds or when the token
+itself expires, whichever comes first.
+
+Tokens signed with an HMAC algorithm are verified directly with `hmac`
+and parsed with `orjson`; other algorithms go through `jwt.decode`.
+
+Functions:
+    decode_cached: Decodes a JWT token, reusing a cached payload when possible.
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+
+import jwt
+import orjson
+from cachetools import TTLCache
+
+from src.conf.config import settings
+from src.core.jwt_keys import ALGORITHMS, HMAC_DIGESTS, VERIFY_KEY
+
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.JWT_CACHE_TTL)
+
+
+def _b64decode(segment: bytes) -> bytes:
+    """Decodes an unpadded base64url segment."""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _decode_hmac(token: str) -> dict:
+    """Verifies an HMAC-signed token and returns its payload.
+
+    Args:
+        token (str): The JWT token to decode.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        jwt.PyJWTError: If the token is malformed, uses another algorithm,
+            has a bad signature or has expired.
+    """
+    try:
+        signing_input, signature = token.encode().rsplit(b".", 1)
+        header_segment, payload_segment = signing_input.split(b".", 1)
+        header = orjson.loads(_b64decode(header_segment))
+        payload = orjson.loads(_b64decode(payload_segment))
+        signature = _b64decode(signature)
+    except ValueError as e:
+        raise jwt.DecodeError("Invalid token") from e
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid token")
+    if header.get("alg") != settings.ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    digest = hmac.new(VERIFY_KEY, signing_input, HMAC_DIGESTS[settings.ALGORITHM])
+    if not hmac.compare_digest(digest.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be a number")
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    nbf = payload.get("nbf")
+    if nbf is not None:
+        if not isinstance(nbf, (int, float)):
+            raise jwt.DecodeError("Not Before claim (nbf) must be a number")
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    return payload
+
+
+def _decode_pyjwt(token: str) -> dict:
+    """Decodes a token with PyJWT using the configured verification key."""
+    return jwt.decode(token, VERIFY_KEY, algorithms=ALGORITHMS)
+
+
+_decode = _decode_hmac if settings.ALGORITHM in HMAC_DIGESTS else _decode_pyjwt
+
+
+def decode_cached(token: str) -> dict:
+    """Decodes a JWT token, reusing a cached payload when possible.
+
+    Args:
+        token (str): The JWT token to decode.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid, expired or cannot be decoded.
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    payload = _cache.get(key)
+    if payload is not None and payload.get("exp", float("inf")) > time.time():
+        return payload
+    payload = _decode(token)
+    _cache[key] = payload
+    return payload
@@ -0,0 +1,62 @@
+"""
+Encoding of JWT tokens.
+
+For HMAC algorithms this module builds the base64url header segment and an
+`hmac` object keyed with the signing key once at import time, so encoding a
+token only serializes the claims and signs them with a copy of that object.
+Other algorithms are encoded with `jwt.encode`.
+
+Functions:
+    encode_token: Encodes claims into a signed JWT token.
+"""
+
+import base64
+import hmac
+from datetime import datetime
+
+import jwt
+import orjson
+
+from src.conf.config import settings
+from src.core.jwt_keys import HMAC_DIGESTS, SIGNING_KEY
+
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Encodes bytes as unpadded base64url."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+if settings.ALGORITHM in HMAC_DIGESTS:
+    _HEADER_SEGMENT = _b64encode(
+        orjson.dumps({"alg": settings.ALGORITHM, "typ": "JWT"})
+    )
+    _HMAC = hmac.new(SIGNING_KEY, digestmod=HMAC_DIGESTS[settings.ALGORITHM])
+
+
+def encode_token(claims: dict) -> str:
+    """Encodes claims into a signed JWT token.
+
+    Like `jwt.encode`, datetime values of the `exp`, `iat` and `nbf` claims
+    are converted to POSIX timestamps.
+
+    Args:
+        claims (dict): The token payload.
+
+    Returns:
+        str: The encoded token.
+    """
+    if settings.ALGORITHM not in HMAC_DIGESTS:
+        return jwt.encode(claims, SIGNING_KEY, algorithm=settings.ALGORITHM)
+
+    payload = {
+        key: int(value.timestamp())
+        if key in _TIME_CLAIMS and isinstance(value, datetime)
+        else value
+        for key, value in claims.items()
+    }
+    signing_input = _HEADER_SEGMENT + b"." + _b64encode(orjson.dumps(payload))
+    mac = _HMAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64encode(mac.digest())).decode()
@@ -0,0 +1,35 @@
+"""
+Preloaded JWT signing and verification keys.
+
+This module materializes the keys used with PyJWT once at import time so
+token encoding and decoding do not re-interpret `settings.SECRET_KEY` on
+every call. For HMAC algorithms both keys are the raw secret bytes; for
+RSA/ECDSA algorithms `SECRET_KEY` holds a PEM private key which is parsed
+once and its public half is used for verification.
+
+Attributes:
+    SIGNING_KEY: The key passed to `jwt.encode`.
+    VERIFY_KEY: The key passed to `jwt.decode`.
+    ALGORITHMS (list[str]): The algorithms accepted by `jwt.decode`.
+    HMAC_DIGESTS (dict): The hash constructor of each HMAC algorithm.
+"""
+
+import hashlib
+
+from src.conf.config import settings
+
+if settings.ALGORITHM.startswith(("RS", "ES", "PS")):
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    SIGNING_KEY = load_pem_private_key(settings.SECRET_KEY.encode(), password=None)
+    VERIFY_KEY = SIGNING_KEY.public_key()
+else:
+    SIGNING_KEY = VERIFY_KEY = settings.SECRET_KEY.encode()
+
+ALGORITHMS = [settings.ALGORITHM]
+
+HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
@@ -0,0 +1,33 @@
+"""
+Shared request rate limiter.
+
+This module provides the slowapi limiter used by the routers. Counters are
+kept in Redis so that a limit holds across all uvicorn workers instead of
+being multiplied by their number. If Redis is unreachable the limiter falls
+back to per-process memory until the storage recovers.
+
+slowapi talks to Redis through the synchronous storage of `limits`, so every
+check blocks the event loop for one round trip. The socket timeouts bound
+that stall: a slow or unreachable Redis costs a request at most
+`settings.RATE_LIMIT_REDIS_TIMEOUT` seconds before the limiter falls back,
+instead of freezing every request served by the worker.
+
+Attributes:
+    limiter (Limiter): The application-wide rate limiter.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from src.conf.config import settings
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL,
+    storage_options={
+        "socket_timeout": settings.RATE_LIMIT_REDIS_TIMEOUT,
+        "socket_connect_timeout": settings.RATE_LIMIT_REDIS_TIMEOUT,
+    },
+    key_prefix="rl",
+    in_memory_fallback_enabled=True,
+)
@@ -1,17 +1,26 @@
 """
 Utility functions for creating password reset tokens.
 
-This module provides a helper function for generating JWT tokens
-used in password reset functionality.
+This module provides helpers for generating the JWT tokens used in password
+reset functionality and for recording which user a token was issued for.
+Tokens are only stored in Redis under their SHA-256 digest, so the Redis
+data never holds a usable token.
 
 Functions:
     create_reset_token: Generates a JWT token for password reset.
+    reset_key: Builds the Redis key of a password reset token.
+    issue_reset_token: Generates a reset token and records its user in Redis.
 """
 
+import hashlib
 from datetime import datetime, timedelta, timezone
-import jwt
 
-from src.conf.config import settings
+import orjson
+
+from src.core.jwt_encode import encode_token
+from src.database.redis import redis_client
+
+_RESET_TTL = timedelta(minutes=15)
 
 
 def create_reset_token(data: dict) -> str:
@@ -25,7 +34,41 @@ def create_reset_token(data: dict) -> str:
         str: A JWT token encoded with the provided data and expiration time.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"iat": datetime.now(timezone.utc), "exp": expire})
-    token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    now = datetime.now(timezone.utc)
+    to_encode.update({"iat": now, "exp": now + _RESET_TTL})
+    token = encode_token(to_encode)
+    return token
+
+
+def reset_key(token: str) -> bytes:
+    """Builds the Redis key of a password reset token.
+
+    The key holds the token's SHA-256 digest, so tokens never sit in Redis in
+    a usable form and the lookup does not depend on the token's characters.
+
+    Args:
+        token (str): The reset token.
+
+    Returns:
+        bytes: The Redis key.
+    """
+    return b"reset_token:" + hashlib.sha256(token.encode()).digest()
+
+
+async def issue_reset_token(user_id: int, username: str, email: str) -> str:
+    """Generates a reset token and records the user it was issued for.
+
+    Args:
+        user_id (int): The ID of the user resetting their password.
+        username (str): The username of the user.
+        email (str): The email address of the user.
+
+    Returns:
+        str: The reset token, valid until it expires or is used once.
+    """
+    token = create_reset_token({"sub": email})
+    reset = {"id": user_id, "username": username}
+    await redis_client.setex(
+        reset_key(token), int(_RESET_TTL.total_seconds()), orjson.dumps(reset)
+    )
     return token
@@ -9,12 +9,16 @@ Classes:
     DatabaseSessionManager: Manages the lifecycle of database sessions.
 
 Functions:
+    normalize_db_url: Ensures PostgreSQL URLs use the asyncpg driver.
     get_db: Provides a database session for FastAPI dependency injection.
 """
 
+import asyncio
 import contextlib
 import logging
+from uuid import uuid4
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -27,6 +31,22 @@ from src.conf.config import settings
 logger = logging.getLogger("uvicorn.error")
 
 
+def normalize_db_url(url: str) -> str:
+    """Ensures PostgreSQL URLs use the asyncpg driver.
+
+    Args:
+        url (str): The database connection URL.
+
+    Returns:
+        str: The URL with a bare ``postgresql://`` or ``postgres://`` scheme
+        replaced by ``postgresql+asyncpg://``. Other URLs are returned unchanged.
+    """
+    for scheme in ("postgresql://", "postgres://"):
+        if url.startswith(scheme):
+            return "postgresql+asyncpg://" + url[len(scheme) :]
+    return url
+
+
 class DatabaseSessionManager:
     """Manages the lifecycle of asynchronous database sessions.
 
@@ -38,17 +58,80 @@ class DatabaseSessionManager:
         _session_maker (async_sessionmaker): The session maker for creating sessions.
     """
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 10,
+        pgbouncer: bool = False,
+    ):
         """Initializes the DatabaseSessionManager with the given database URL.
 
         Args:
             url (str): The database connection URL.
+            pool_size (int): The number of connections kept open in the pool.
+            max_overflow (int): The number of extra connections allowed on top
+                of ``pool_size`` under load.
+            pool_timeout (int): Seconds to wait for a free connection before
+                giving up.
+            pgbouncer (bool): Whether the URL points at PgBouncer in transaction
+                mode. Prepared statement caching is then disabled and statement
+                names are made unique, since consecutive transactions may run
+                on different server connections. Pre-ping is skipped as well,
+                because PgBouncer already checks its server connections.
         """
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        connect_args = {}
+        if pgbouncer:
+            connect_args = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        self._engine: AsyncEngine | None = create_async_engine(
+            normalize_db_url(url),
+            connect_args=connect_args,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=not pgbouncer,
+            pool_recycle=1800,
+            pool_timeout=pool_timeout,
+            pool_use_lifo=True,
+            query_cache_size=1200,
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
             autoflush=False, autocommit=False, bind=self._engine
         )
 
+    async def prewarm(self, connections: int) -> None:
+        """Opens pooled connections ahead of time so first requests do not pay for them.
+
+        Every connection that opened is returned to the pool, even when
+        another one fails to connect.
+
+        Args:
+            connections (int): The number of connections to open.
+
+        Raises:
+            Exception: The first error raised while connecting.
+        """
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(connections)),
+            return_exceptions=True,
+        )
+        conns = [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        try:
+            if errors:
+                raise errors[0]
+            await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+        finally:
+            await asyncio.gather(*(conn.close() for conn in conns))
+
+    async def dispose(self) -> None:
+        """Closes every pooled connection, e.g. on application shutdown."""
+        await self._engine.dispose()
+
     @contextlib.asynccontextmanager
     async def session(self):
         """Provides an asynchronous context manager for database sessions.
@@ -78,7 +161,13 @@ class DatabaseSessionManager:
             await session.close()
 
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL,
+    pool_size=settings.POOL_SIZE,
+    max_overflow=settings.MAX_OVERFLOW,
+    pool_timeout=settings.POOL_TIMEOUT,
+    pgbouncer=settings.DB_PGBOUNCER,
+)
 """
 Instance of DatabaseSessionManager.
 
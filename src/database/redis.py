@@ -0,0 +1,24 @@
+"""
+Shared Redis connection pool for the application.
+
+Every module that talks to Redis imports the client from here, so the whole
+process uses one bounded pool instead of one pool per importing module.
+
+Attributes:
+    redis_pool: The bounded connection pool, disconnected on shutdown.
+    redis_client: The client bound to `redis_pool`.
+"""
+
+import redis.asyncio as redis
+
+from src.conf.config import settings
+
+# a bounded pool makes callers wait for a free connection instead of opening
+# an unbounded number of sockets under load
+redis_pool = redis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,
+    health_check_interval=30,
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
@@ -11,6 +11,9 @@ Classes:
     Contact: Represents a contact entity in the database.
     User: Represents a user entity in the database.
     RefreshToken: Represents a refresh token entity in the database.
+
+Attributes:
+    CONTACT_SEARCH_TEXT: SQL expression concatenating the searchable contact fields.
 """
 
 from datetime import datetime
@@ -18,13 +21,22 @@ from enum import Enum
 
 from sqlalchemy import (
     String,
+    LargeBinary,
     DateTime,
     Date,
     func,
     ForeignKey,
     Text,
     Boolean,
+    Index,
+    Integer,
+    Computed,
+    cast,
+    column,
+    extract,
+    literal_column,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -58,6 +70,8 @@ class Contact(Base):
         email (str): Email address of the contact.
         phone (str): Phone number of the contact (optional).
         birthday (datetime): Birthday of the contact.
+        birthday_mmdd (int): Month and day of the birthday as MMDD, computed
+            by the database from `birthday`.
         optional_data (str): Additional optional data about the contact.
         created_at (datetime): Timestamp when the contact was created.
         updated_at (datetime): Timestamp when the contact was last updated.
@@ -66,6 +80,10 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_id_birthday_mmdd", "user_id", "birthday_mmdd"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     first_name: Mapped[str] = mapped_column(
@@ -81,6 +99,17 @@ class Contact(Base):
         String(constants.MAX_LENGTH_PHONE), nullable=True
     )
     birthday: Mapped[datetime] = mapped_column(Date, nullable=False)
+    birthday_mmdd: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            cast(
+                extract("month", column("birthday")) * 100
+                + extract("day", column("birthday")),
+                Integer,
+            ),
+            persisted=True,
+        ),
+    )
     optional_data: Mapped[str] = mapped_column(
         String(constants.MAX_LENGTH_OPTIONAL_DATA), nullable=True
     )
@@ -90,7 +119,32 @@ class Contact(Base):
     )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
 
-    user: Mapped["User"] = relationship("User", backref="contacts", lazy="joined")
+    user: Mapped["User"] = relationship("User", backref="contacts", lazy="select")
+
+
+_SPACE = literal_column("' '")
+CONTACT_SEARCH_TEXT = (
+    Contact.first_name
+    + _SPACE
+    + Contact.last_name
+    + _SPACE
+    + Contact.email
+    + _SPACE
+    + func.coalesce(Contact.phone, literal_column("''"))
+)
+"""
+The searchable text of a contact, matched by the trigram index below.
+
+Separators are inlined as SQL literals rather than bound parameters so the
+planner can match the query expression against the index expression.
+"""
+
+Index(
+    "ix_contacts_search_trgm",
+    CONTACT_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
 
 
 class User(Base):
@@ -130,7 +184,7 @@ class RefreshToken(Base):
     Attributes:
         id (int): Primary key of the refresh token.
         user_id (int): Foreign key referencing the associated user.
-        token_hash (str): Hashed value of the refresh token.
+        token_hash (bytes): SHA-256 digest of the refresh token.
         created_at (datetime): Timestamp when the token was created.
         expires_at (datetime): Timestamp when the token will expire.
         revoked_at (datetime): Timestamp when the token was revoked (optional).
@@ -140,10 +194,20 @@ class RefreshToken(Base):
     """
 
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    token_hash: Mapped[str] = mapped_column(nullable=False, unique=True)
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), nullable=False, unique=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), nullable=False
     )
@@ -0,0 +1,68 @@
+"""
+Periodic cleanup of expired and revoked refresh tokens.
+
+This module defines the job that purges refresh tokens which can no longer
+be used. The job is scheduled either inside the web process (see `main.py`)
+or by the standalone worker in `src.jobs.cleanup_worker`.
+
+Attributes:
+    CLEANUP_INTERVAL_HOURS (int): How often the cleanup job runs.
+    CLEANUP_BATCH_SIZE (int): Maximum number of rows deleted per statement.
+
+Functions:
+    cleanup_expired_tokens: Deletes expired and long-revoked refresh tokens.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from src.database.db import sessionmanager
+
+logger = logging.getLogger("uvicorn.error")
+
+CLEANUP_INTERVAL_HOURS = 1
+CLEANUP_BATCH_SIZE = 1000
+
+# One statement per index: Postgres cannot use both indexes for an OR predicate
+# without a BitmapOr, so expired and revoked tokens are purged separately.
+CLEANUP_STATEMENTS = (
+    text(
+        "DELETE FROM refresh_tokens WHERE id IN ("
+        "SELECT id FROM refresh_tokens WHERE expires_at < :now "
+        "LIMIT :batch) RETURNING id"
+    ),
+    text(
+        "DELETE FROM refresh_tokens WHERE id IN ("
+        "SELECT id FROM refresh_tokens "
+        "WHERE revoked_at IS NOT NULL AND revoked_at < :cutoff "
+        "LIMIT :batch) RETURNING id"
+    ),
+)
+
+
+async def cleanup_expired_tokens() -> int:
+    """Deletes expired and long-revoked refresh tokens in bounded batches.
+
+    Returns:
+        int: The number of deleted refresh tokens.
+    """
+    async with sessionmanager.session() as db:
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=7)
+        params = {"now": now, "cutoff": cutoff, "batch": CLEANUP_BATCH_SIZE}
+        deleted = 0
+        for stmt in CLEANUP_STATEMENTS:
+            while True:
+                result = await db.execute(stmt, params)
+                rows = result.fetchall()
+                await db.commit()
+                deleted += len(rows)
+                if len(rows) < CLEANUP_BATCH_SIZE:
+                    break
+        if deleted:
+            logger.info(
+                "Expired tokens cleaned up: %d rows at %s", deleted, now.isoformat()
+            )
+        return deleted
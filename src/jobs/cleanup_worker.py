@@ -0,0 +1,31 @@
+"""
+Standalone worker for background jobs.
+
+Runs the refresh token cleanup on its own event loop so long-running
+deletes never compete with request handling in the web process. Start it
+with `python -m src.jobs.cleanup_worker` and set
+`ENABLE_BACKGROUND_JOBS=false` for the web containers.
+"""
+
+import asyncio
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from src.jobs.cleanup import CLEANUP_INTERVAL_HOURS, cleanup_expired_tokens
+
+
+async def main() -> None:
+    """Schedules the cleanup job and keeps the worker running."""
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(cleanup_expired_tokens, "interval", hours=CLEANUP_INTERVAL_HOURS)
+    scheduler.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
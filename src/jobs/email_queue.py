@@ -0,0 +1,157 @@
+"""
+Redis-backed queue for outgoing emails.
+
+Route handlers push email jobs onto a Redis list and return right away; a
+separate worker (`src.jobs.email_worker`) takes them and talks to the SMTP
+server, so mail delivery latency never holds up request handling. If Redis
+is unavailable when a job is queued, the email is sent from the web process
+as a background task instead.
+
+The worker moves each job onto a processing list with BLMOVE while it sends
+it, and removes it from there only once it is delivered, requeued or
+dead-lettered. A job left on the processing list by a crashed worker is put
+back on the queue when a worker starts, so delivery is at least once: such
+an email may be sent twice, but it is not lost. With several workers, one
+that starts also requeues the jobs the others are sending, which again only
+risks duplicates.
+
+Attributes:
+    EMAIL_QUEUE_KEY (str): The Redis list holding pending email jobs.
+    EMAIL_PROCESSING_KEY (str): The Redis list holding jobs being sent.
+    EMAIL_DEAD_KEY (str): The Redis list holding jobs that were given up on.
+    MAX_ATTEMPTS (int): How many times a job is tried before it is
+        dead-lettered.
+
+Functions:
+    enqueue_email: Queues an email job.
+    process_next: Sends the next queued email, requeueing it on failure.
+    requeue_unfinished: Puts jobs left by a crashed worker back on the queue.
+"""
+
+import logging
+
+import orjson
+from fastapi import BackgroundTasks
+from redis.exceptions import RedisError
+
+from src.core.reset_token import issue_reset_token
+from src.database.redis import redis_client
+from src.services.email import send_email, send_reset_password_email
+
+logger = logging.getLogger("uvicorn.error")
+
+EMAIL_QUEUE_KEY = "email:queue"
+EMAIL_PROCESSING_KEY = "email:processing"
+EMAIL_DEAD_KEY = "email:dead"
+MAX_ATTEMPTS = 3
+
+
+async def _send_reset_password(
+    email: str, username: str, host: str, user_id: int
+) -> bool:
+    """Issues a reset token and sends it in a password reset email.
+
+    The token is only created when the email is about to be sent, so jobs
+    waiting in the queue carry no usable credential.
+
+    Args:
+        email (str): The recipient's email address.
+        username (str): The username of the recipient.
+        host (str): The host URL for the password reset link.
+        user_id (int): The ID of the user resetting their password.
+
+    Returns:
+        bool: True if the email was sent.
+    """
+    token = await issue_reset_token(user_id, username, email)
+    return await send_reset_password_email(email, username, host, token)
+
+
+_SENDERS = {
+    "verify": send_email,
+    "reset_password": _send_reset_password,
+}
+
+
+async def enqueue_email(
+    background_tasks: BackgroundTasks, kind: str, **kwargs: str | int
+) -> None:
+    """Queues an email job.
+
+    Args:
+        background_tasks (BackgroundTasks): Used to send the email in-process
+            if the queue is unavailable.
+        kind (str): The email to send, either "verify" or "reset_password".
+        **kwargs (str | int): The arguments of the matching send function.
+    """
+    job = orjson.dumps({"kind": kind, "kwargs": kwargs, "attempts": 0})
+    try:
+        await redis_client.lpush(EMAIL_QUEUE_KEY, job)
+    except RedisError as e:
+        logger.warning("Email queue unavailable, sending in-process: %s", e)
+        background_tasks.add_task(_SENDERS[kind], **kwargs)
+
+
+async def process_next(timeout: int = 5) -> bool:
+    """Sends the next queued email, requeueing it on failure.
+
+    Any exception raised while sending counts as a failed attempt, so a
+    broken template or an invalid message cannot stop the worker. A job that
+    cannot be decoded, or that failed MAX_ATTEMPTS times, is moved to the
+    dead-letter list.
+
+    Args:
+        timeout (int): Seconds to wait for a job before giving up.
+
+    Returns:
+        bool: True if a job was taken from the queue, False if none arrived.
+    """
+    raw = await redis_client.blmove(
+        EMAIL_QUEUE_KEY, EMAIL_PROCESSING_KEY, timeout, "RIGHT", "LEFT"
+    )
+    if raw is None:
+        return False
+    try:
+        job = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        logger.error("Dead-lettering malformed email job %r", raw)
+        await redis_client.lpush(EMAIL_DEAD_KEY, raw)
+        await redis_client.lrem(EMAIL_PROCESSING_KEY, 1, raw)
+        return True
+
+    try:
+        sent = await _SENDERS[job["kind"]](**job["kwargs"])
+    except Exception:
+        logger.exception("Sending %s email failed", job.get("kind"))
+        sent = False
+    if not sent:
+        job["attempts"] += 1
+        if job["attempts"] < MAX_ATTEMPTS:
+            await redis_client.lpush(EMAIL_QUEUE_KEY, orjson.dumps(job))
+        else:
+            logger.error(
+                "Dead-lettering %s email to %s after %d attempts",
+                job["kind"],
+                job["kwargs"].get("email"),
+                job["attempts"],
+            )
+            await redis_client.lpush(EMAIL_DEAD_KEY, orjson.dumps(job))
+    await redis_client.lrem(EMAIL_PROCESSING_KEY, 1, raw)
+    return True
+
+
+async def requeue_unfinished() -> int:
+    """Puts jobs left on the processing list back on the queue.
+
+    Meant to run when a worker starts, before it takes new jobs; the oldest
+    unfinished job is the next one taken.
+
+    Returns:
+        int: The number of jobs requeued.
+    """
+    requeued = 0
+    while await redis_client.lmove(
+        EMAIL_PROCESSING_KEY, EMAIL_QUEUE_KEY, "LEFT", "RIGHT"
+    ):
+        requeued += 1
+    return requeued
@@ -0,0 +1,42 @@
+"""
+Standalone worker delivering queued emails.
+
+Pops jobs pushed by `src.jobs.email_queue.enqueue_email` and sends them
+over SMTP, outside the web process. Start it with
+`python -m src.jobs.email_worker`.
+"""
+
+import asyncio
+import logging
+
+from redis.exceptions import RedisError
+
+from src.jobs.email_queue import process_next, requeue_unfinished
+
+logger = logging.getLogger("uvicorn.error")
+
+
+async def main() -> None:
+    """Processes queued emails until the worker is stopped.
+
+    Jobs left unfinished by a previous run are requeued first. Failures of a
+    single job are handled by `process_next`; only an unreachable Redis makes
+    the worker wait and retry.
+    """
+    recovered = False
+    while True:
+        try:
+            if not recovered:
+                requeued = await requeue_unfinished()
+                if requeued:
+                    logger.warning("Requeued %d unfinished email jobs", requeued)
+                recovered = True
+            await process_next()
+        except RedisError as e:
+            logger.warning("Email queue unavailable: %s", e)
+            await asyncio.sleep(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -9,9 +9,10 @@ Classes:
     BaseRepository: A generic repository for performing CRUD operations.
 """
 
-from typing import TypeVar, Type
+from functools import lru_cache
+from typing import AsyncIterator, TypeVar, Type
 
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.entity.models import Base
@@ -19,6 +20,19 @@ from src.entity.models import Base
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+@lru_cache(maxsize=None)
+def _get_by_id_stmt(model: Type[ModelType]) -> Select:
+    """Builds the statement selecting a record of `model` by ID once per model.
+
+    Args:
+        model (Type[ModelType]): The SQLAlchemy model to select from.
+
+    Returns:
+        Select: A statement expecting an ``id`` bind parameter.
+    """
+    return select(model).where(model.id == bindparam("id"))
+
+
 class BaseRepository:
     """A generic repository for performing CRUD operations on SQLAlchemy models.
 
@@ -44,6 +58,9 @@ class BaseRepository:
     async def get_all(self) -> list[ModelType]:
         """Retrieves all records of the model from the database.
 
+        The whole table is loaded into memory, so this is only meant for small
+        lookup tables. Use `iter_all` for anything that can grow.
+
         Returns:
             list[ModelType]: A list of all records of the model.
         """
@@ -51,6 +68,20 @@ class BaseRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[ModelType]:
+        """Streams all records of the model using a server-side cursor.
+
+        Args:
+            chunk_size (int): The number of rows fetched from the cursor at once.
+
+        Yields:
+            ModelType: The records of the model, one at a time.
+        """
+        stmt = select(self.model).execution_options(yield_per=chunk_size)
+        result = await self.db.stream_scalars(stmt)
+        async for record in result:
+            yield record
+
     async def get_by_id(self, _id: int) -> ModelType | None:
         """Retrieves a record by its ID.
 
@@ -60,8 +91,7 @@ class BaseRepository:
         Returns:
             ModelType | None: The record with the specified ID, or None if not found.
         """
-        stmt = select(self.model).filter_by(id=_id)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_get_by_id_stmt(self.model), {"id": _id})
         return result.scalar_one_or_none()
 
     async def create(self, instance: ModelType) -> ModelType:
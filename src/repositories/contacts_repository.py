@@ -12,14 +12,70 @@ import logging
 from datetime import date, timedelta
 from typing import Sequence
 
-from sqlalchemy import select, or_, extract, and_
+from sqlalchemy import Row, bindparam, delete, func, insert, select, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.entity.models import Contact, User
+from src.entity.models import CONTACT_SEARCH_TEXT, Contact
 from src.schemas.contacts import BaseContact, UpdateContact
+from src.schemas.user import CurrentUser
 
 logger = logging.getLogger("uvicorn.error")
 
+# Columns served by the read-only list endpoints. Selecting them as plain rows
+# skips ORM instance construction and identity-map bookkeeping.
+_CONTACT_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birthday,
+    Contact.optional_data,
+)
+
+_STMT_CONTACTS_PAGE = (
+    select(*_CONTACT_COLUMNS)
+    .where(Contact.user_id == bindparam("uid"), Contact.id > bindparam("cursor"))
+    .order_by(Contact.id)
+    .limit(bindparam("limit"))
+)
+# Wildcards typed by the user are matched literally, so a bare "%" or "_"
+# cannot turn the trigram index probe into a match-everything scan.
+_LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+_STMT_CONTACTS_SEARCH = (
+    select(*_CONTACT_COLUMNS)
+    .where(
+        Contact.user_id == bindparam("uid"),
+        CONTACT_SEARCH_TEXT.ilike(bindparam("pattern"), escape="\\"),
+        Contact.id > bindparam("cursor"),
+    )
+    .order_by(Contact.id)
+    .limit(bindparam("limit"))
+)
+_STMT_CONTACT_BY_ID = select(Contact).where(
+    Contact.id == bindparam("cid"), Contact.user_id == bindparam("uid")
+)
+# Cheap validators for conditional reads: every write moves one of these
+_STMT_CONTACTS_VERSION = select(
+    func.count(Contact.id), func.max(Contact.id), func.max(Contact.updated_at)
+).where(Contact.user_id == bindparam("uid"))
+_STMT_CONTACT_VERSION = select(Contact.updated_at).where(
+    Contact.id == bindparam("cid"), Contact.user_id == bindparam("uid")
+)
+# Upcoming birthdays come in two shapes, picked in Python per call: a plain
+# range, and a range that wraps around the new year.
+_STMT_BIRTHDAYS_IN_RANGE = select(*_CONTACT_COLUMNS).where(
+    Contact.user_id == bindparam("uid"),
+    Contact.birthday_mmdd.between(bindparam("start"), bindparam("end")),
+)
+_STMT_BIRTHDAYS_WRAPPED = select(*_CONTACT_COLUMNS).where(
+    Contact.user_id == bindparam("uid"),
+    or_(
+        Contact.birthday_mmdd >= bindparam("start"),
+        Contact.birthday_mmdd <= bindparam("end"),
+    ),
+)
+
 
 class ContactsRepository:
     """A repository for managing contact-related database operations.
@@ -37,156 +93,197 @@ class ContactsRepository:
         self.db = session
 
     async def get_contacts(
-        self, user: User, limit: int, offset: int
-    ) -> Sequence[Contact]:
-        """Retrieves a paginated list of contacts for a specific user.
+        self, user: CurrentUser, limit: int, cursor: int | None = None
+    ) -> Sequence[Row]:
+        """Retrieves a page of contacts for a specific user ordered by ID.
+
+        Pagination is keyset-based: the next page starts after the ID of the
+        last contact of the previous one, so deep pages cost the same as the
+        first one.
 
         Args:
-            user (User): The user whose contacts are being retrieved.
+            user (CurrentUser): The user whose contacts are being retrieved.
             limit (int): The maximum number of contacts to retrieve.
-            offset (int): The number of contacts to skip.
+            cursor (int | None, optional): The ID of the last contact of the
+                previous page. Defaults to None, which returns the first page.
 
         Returns:
-            Sequence[Contact]: A list of contacts belonging to the user.
+            Sequence[Row]: A list of contacts belonging to the user.
         """
-        query = select(Contact).filter_by(user_id=user.id).limit(limit).offset(offset)
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        result = await self.db.execute(
+            _STMT_CONTACTS_PAGE,
+            {"uid": user.id, "cursor": cursor or 0, "limit": limit},
+        )
+        return result.all()
 
-    async def get_contact_by_id(self, user: User, contact_id: int) -> Contact | None:
+    async def get_contact_by_id(self, user: CurrentUser, contact_id: int) -> Contact | None:
         """Retrieves a specific contact by its ID for a given user.
 
         Args:
-            user (User): The user who owns the contact.
+            user (CurrentUser): The user who owns the contact.
             contact_id (int): The ID of the contact to retrieve.
 
         Returns:
             Contact | None: The contact if found, or None if not found.
         """
-        query = select(Contact).filter_by(id=contact_id, user_id=user.id)
-        result = await self.db.execute(query)
+        result = await self.db.execute(
+            _STMT_CONTACT_BY_ID, {"cid": contact_id, "uid": user.id}
+        )
         return result.scalar_one_or_none()
 
-    async def create_contact(self, user: User, body: BaseContact) -> Contact:
+    async def get_contacts_version(self, user: CurrentUser) -> tuple:
+        """Retrieves a cheap version of a user's contacts.
+
+        Creating a contact raises the count and the highest ID, deleting one
+        lowers the count and updating one moves the latest `updated_at`.
+
+        Args:
+            user (CurrentUser): The user whose contacts are versioned.
+
+        Returns:
+            tuple: The number of contacts, the highest ID and the latest
+            `updated_at`.
+        """
+        result = await self.db.execute(_STMT_CONTACTS_VERSION, {"uid": user.id})
+        return tuple(result.one())
+
+    async def get_contact_version(self, user: CurrentUser, contact_id: int):
+        """Retrieves when a specific contact was last updated.
+
+        Args:
+            user (CurrentUser): The user who owns the contact.
+            contact_id (int): The ID of the contact.
+
+        Returns:
+            datetime | None: The contact's `updated_at`, or None if the user
+            has no such contact.
+        """
+        result = await self.db.execute(
+            _STMT_CONTACT_VERSION, {"cid": contact_id, "uid": user.id}
+        )
+        return result.scalar_one_or_none()
+
+    async def create_contact(self, user: CurrentUser, body: BaseContact) -> Contact:
         """Creates a new contact for a specific user.
 
         Args:
-            user (User): The user who owns the contact.
+            user (CurrentUser): The user who owns the contact.
             body (BaseContact): The data for the new contact.
 
         Returns:
             Contact: The created contact instance.
         """
-        new_contact = Contact(**body.model_dump(), user=user)
-        self.db.add(new_contact)
+        stmt = (
+            insert(Contact)
+            .values(**body.model_dump(), user_id=user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        new_contact = result.scalar_one()
+        self.db.expunge(new_contact)
         await self.db.commit()
-        await self.db.refresh(new_contact)
         return new_contact
 
     async def update_contact(
-        self, user: User, contact_id: int, body: UpdateContact
+        self, user: CurrentUser, contact_id: int, body: UpdateContact
     ) -> Contact | None:
         """Updates an existing contact for a specific user.
 
         Args:
-            user (User): The user who owns the contact.
+            user (CurrentUser): The user who owns the contact.
             contact_id (int): The ID of the contact to update.
             body (UpdateContact): The updated data for the contact.
 
         Returns:
             Contact | None: The updated contact if found, or None if not found.
         """
-        contact = await self.get_contact_by_id(user, contact_id)
+        update_data = body.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_contact_by_id(user, contact_id)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**update_data)
+            .returning(Contact)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            update_data = body.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(contact, key, value)
-            await self.db.commit()
-            await self.db.refresh(contact)
+            # keep the returned state instead of expiring it on commit
+            self.db.expunge(contact)
+        await self.db.commit()
         return contact
 
-    async def remove_contact(self, user: User, contact_id: int) -> Contact | None:
+    async def remove_contact(self, user: CurrentUser, contact_id: int) -> int | None:
         """Deletes a contact for a specific user.
 
         Args:
-            user (User): The user who owns the contact.
+            user (CurrentUser): The user who owns the contact.
             contact_id (int): The ID of the contact to delete.
 
         Returns:
-            Contact | None: The deleted contact if found, or None if not found.
+            int | None: The ID of the deleted contact if found, or None if not found.
         """
-        contact = await self.get_contact_by_id(user, contact_id)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
-        return contact
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.db.execute(stmt)
+        deleted_id = result.scalar_one_or_none()
+        await self.db.commit()
+        return deleted_id
 
     async def search_contacts(
-        self, user: User, query: str, limit: int = 10, offset: int = 0
-    ) -> Sequence[Contact]:
+        self, user: CurrentUser, query: str, limit: int = 10, cursor: int | None = None
+    ) -> Sequence[Row]:
         """Searches for contacts by name, email, or phone for a specific user.
 
         Args:
-            user (User): The user who owns the contacts.
+            user (CurrentUser): The user who owns the contacts.
             query (str): The search query string.
             limit (int, optional): The maximum number of contacts to retrieve. Defaults to 10.
-            offset (int, optional): The number of contacts to skip. Defaults to 0.
+            cursor (int | None, optional): The ID of the last contact of the
+                previous page. Defaults to None, which returns the first page.
 
         Returns:
-            Sequence[Contact]: A list of contacts matching the search query.
+            Sequence[Row]: A list of contacts matching the search query.
         """
-        query = (
-            select(Contact)
-            .where(
-                and_(
-                    Contact.user_id == user.id,
-                    or_(
-                        Contact.first_name.ilike(f"%{query}%"),
-                        Contact.last_name.ilike(f"%{query}%"),
-                        Contact.email.ilike(f"%{query}%"),
-                        Contact.phone.ilike(f"%{query}%"),
-                    ),
-                )
-            )
-            .limit(limit)
-            .offset(offset)
+        result = await self.db.execute(
+            _STMT_CONTACTS_SEARCH,
+            {
+                "uid": user.id,
+                "pattern": f"%{query.translate(_LIKE_ESCAPE)}%",
+                "cursor": cursor or 0,
+                "limit": limit,
+            },
         )
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_upcoming_birthdays(
-        self, user: User, days_ahead: int = 7
-    ) -> Sequence[Contact]:
+        self, user: CurrentUser, days_ahead: int = 7
+    ) -> Sequence[Row]:
         """Retrieves contacts with upcoming birthdays within a specified number of days.
 
         Args:
-            user (User): The user who owns the contacts.
+            user (CurrentUser): The user who owns the contacts.
             days_ahead (int, optional): The number of days ahead to check for birthdays. Defaults to 7.
 
         Returns:
-            Sequence[Contact]: A list of contacts with upcoming birthdays.
+            Sequence[Row]: A list of contacts with upcoming birthdays.
         """
         today = date.today()
         upcoming_birthday = today + timedelta(days=days_ahead)
-
-        query = select(Contact).where(
-            and_(
-                Contact.user_id == user.id,
-                or_(
-                    and_(
-                        extract("month", Contact.birthday) == today.month,
-                        extract("day", Contact.birthday) >= today.day,
-                    ),
-                    and_(
-                        extract("month", Contact.birthday) == upcoming_birthday.month,
-                        extract("day", Contact.birthday) <= upcoming_birthday.day,
-                    ),
-                    and_(
-                        extract("month", Contact.birthday) > today.month,
-                        extract("month", Contact.birthday) < upcoming_birthday.month,
-                    ),
-                ),
-            )
+        start_mmdd = today.month * 100 + today.day
+        end_mmdd = upcoming_birthday.month * 100 + upcoming_birthday.day
+
+        if start_mmdd <= end_mmdd:
+            stmt = _STMT_BIRTHDAYS_IN_RANGE
+        else:
+            stmt = _STMT_BIRTHDAYS_WRAPPED
+        result = await self.db.execute(
+            stmt, {"uid": user.id, "start": start_mmdd, "end": end_mmdd}
         )
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return result.all()
@@ -3,6 +3,8 @@ Repository for refresh token-related database operations.
 
 This module defines the `RefreshTokenRepository` class, which provides methods
 for managing refresh tokens, including saving, retrieving, and revoking tokens.
+Bulk revocations are issued as set-based UPDATE statements so no rows have to
+be loaded into the session.
 
 Classes:
     RefreshTokenRepository: A repository for managing refresh token-related database operations.
@@ -11,14 +13,28 @@ Classes:
 import logging
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from src.entity.models import RefreshToken
 from src.repositories.base import BaseRepository
 
 logger = logging.getLogger("uvicorn.error")
 
+_STMT_TOKEN_BY_HASH = select(RefreshToken).where(
+    RefreshToken.token_hash == bindparam("token_hash")
+)
+_STMT_ACTIVE_TOKEN = (
+    select(RefreshToken)
+    .options(joinedload(RefreshToken.user))
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.expires_at > bindparam("now"),
+        RefreshToken.revoked_at.is_(None),
+    )
+)
+
 
 class RefreshTokenRepository(BaseRepository):
     """A repository for managing refresh token-related database operations.
@@ -34,43 +50,41 @@ class RefreshTokenRepository(BaseRepository):
         """
         super().__init__(session, RefreshToken)
 
-    async def get_by_token_hash(self, token_hash: str) -> RefreshToken | None:
+    async def get_by_token_hash(self, token_hash: bytes) -> RefreshToken | None:
         """Retrieves a refresh token by its token hash.
 
         Args:
-            token_hash (str): The hash of the refresh token to retrieve.
+            token_hash (bytes): The hash of the refresh token to retrieve.
 
         Returns:
             RefreshToken | None: The refresh token if found, or None if not found.
         """
-        stmt = select(self.model).where(RefreshToken.token_hash == token_hash)
-        token = await self.db.execute(stmt)
+        token = await self.db.execute(_STMT_TOKEN_BY_HASH, {"token_hash": token_hash})
         return token.scalars().first()
 
     async def get_active_token(
-        self, token_hash: str, current_time: datetime
+        self, token_hash: bytes, current_time: datetime
     ) -> RefreshToken | None:
         """Retrieves an active refresh token by its token hash.
 
+        The owning user is loaded in the same query.
+
         Args:
-            token_hash (str): The hash of the refresh token to retrieve.
+            token_hash (bytes): The hash of the refresh token to retrieve.
             current_time (datetime): The current time to check token expiration.
 
         Returns:
             RefreshToken | None: The active refresh token if found, or None if not found.
         """
-        stmt = select(self.model).where(
-            RefreshToken.token_hash == token_hash,
-            RefreshToken.expires_at > current_time,
-            RefreshToken.revoked_at.is_(None),
+        token = await self.db.execute(
+            _STMT_ACTIVE_TOKEN, {"token_hash": token_hash, "now": current_time}
         )
-        token = await self.db.execute(stmt)
         return token.scalars().first()
 
     async def save_token(
         self,
         user_id: int,
-        token_hash: str,
+        token_hash: bytes,
         expires_at: datetime,
         ip_address: str,
         user_agent: str,
@@ -79,7 +93,7 @@ class RefreshTokenRepository(BaseRepository):
 
         Args:
             user_id (int): The ID of the user associated with the token.
-            token_hash (str): The hash of the refresh token.
+            token_hash (bytes): The hash of the refresh token.
             expires_at (datetime): The expiration time of the token.
             ip_address (str): The IP address from which the token was issued.
             user_agent (str): The user agent string of the client.
@@ -97,7 +111,7 @@ class RefreshTokenRepository(BaseRepository):
         return await self.create(refresh_token)
 
     async def revoke_token(self, refresh_token: RefreshToken) -> None:
-        """Revokes a refresh token by setting its revoked_at timestamp.
+        """Revokes a refresh token by letting the database stamp its revoked_at.
 
         Args:
             refresh_token (RefreshToken): The refresh token to revoke.
@@ -105,5 +119,52 @@ class RefreshTokenRepository(BaseRepository):
         Returns:
             None
         """
-        refresh_token.revoked_at = datetime.now()
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id == refresh_token.id)
+            .values(revoked_at=func.now())
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def revoke_by_hash(self, token_hash: bytes) -> bool:
+        """Revokes an active refresh token by its hash in a single UPDATE.
+
+        Args:
+            token_hash (bytes): The hash of the refresh token to revoke.
+
+        Returns:
+            bool: True if a token was revoked, False if none was active.
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def revoke_for_user(self, user_id: int) -> int:
+        """Revokes all active refresh tokens of a user in a single UPDATE.
+
+        Args:
+            user_id (int): The ID of the user whose tokens are revoked.
+
+        Returns:
+            int: The number of revoked tokens.
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+        result = await self.db.execute(stmt)
         await self.db.commit()
+        return result.rowcount
@@ -10,7 +10,7 @@ Classes:
 
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.entity.models import User
@@ -19,6 +19,32 @@ from src.schemas.user import UserCreate
 
 logger = logging.getLogger("uvicorn.error")
 
+_STMT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_STMT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+# a username match sorts first so its conflict is reported before the email's
+_STMT_USER_BY_USERNAME_OR_EMAIL = (
+    select(User)
+    .where(
+        or_(User.username == bindparam("username"), User.email == bindparam("email"))
+    )
+    .order_by((User.username == bindparam("username")).desc())
+    .limit(1)
+)
+# each write commits right away, which expires the session, so there is
+# nothing in the identity map worth synchronizing
+_STMT_CONFIRM_EMAIL = (
+    update(User)
+    .where(User.email == bindparam("email"))
+    .values(confirmed=True)
+    .execution_options(synchronize_session=False)
+)
+_STMT_CHANGE_PASSWORD = (
+    update(User)
+    .where(User.id == bindparam("uid"))
+    .values(hash_password=bindparam("new_hash"))
+    .execution_options(synchronize_session=False)
+)
+
 
 class UserRepository(BaseRepository):
     """A repository for managing user-related database operations.
@@ -45,8 +71,7 @@ class UserRepository(BaseRepository):
         Returns:
             User | None: The user with the specified username, or None if not found.
         """
-        stmt = select(self.model).where(self.model.username == username)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_USER_BY_USERNAME, {"username": username})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -58,8 +83,27 @@ class UserRepository(BaseRepository):
         Returns:
             User | None: The user with the specified email, or None if not found.
         """
-        stmt = select(self.model).where(self.model.email == email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_USER_BY_EMAIL, {"email": email})
+        return user.scalar_one_or_none()
+
+    async def get_by_username_or_email(
+        self, username: str, email: str
+    ) -> User | None:
+        """Retrieves a user matching either the username or the email address.
+
+        When one user has the username and another the email, the user with
+        the username is returned.
+
+        Args:
+            username (str): The username to match.
+            email (str): The email address to match.
+
+        Returns:
+            User | None: The matching user, or None if neither is taken.
+        """
+        user = await self.db.execute(
+            _STMT_USER_BY_USERNAME_OR_EMAIL, {"username": username, "email": email}
+        )
         return user.scalar_one_or_none()
 
     async def create_user(
@@ -82,20 +126,20 @@ class UserRepository(BaseRepository):
         )
         return await self.create(user)
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> bool:
         """Marks a user's email as confirmed.
 
         Args:
             email (str): The email address of the user to confirm.
 
         Returns:
-            None
+            bool: True if a user with the email was found and updated.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        result = await self.db.execute(_STMT_CONFIRM_EMAIL, {"email": email})
         await self.db.commit()
+        return result.rowcount == 1
 
-    async def update_avatar_url(self, email: str, url: str) -> User:
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
         """Updates the avatar URL for a user.
 
         Args:
@@ -103,24 +147,34 @@ class UserRepository(BaseRepository):
             url (str): The new avatar URL.
 
         Returns:
-            User: The updated user instance.
+            User: The updated user instance, or None if the user was not found.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(avatar=url)
+            .returning(User)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user:
+            self.db.expunge(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
-    async def change_password(self, email: str, new_hashed_password: str) -> None:
+    async def change_password(self, user_id: int, new_hashed_password: str) -> bool:
         """Changes the password for a user.
 
         Args:
-            email (str): The email address of the user.
+            user_id (int): The ID of the user.
             new_hashed_password (str): The new hashed password.
 
         Returns:
-            None
+            bool: True if a user with the ID was found and updated.
         """
-        user = await self.get_user_by_email(email)
-        user.hash_password = new_hashed_password
+        result = await self.db.execute(
+            _STMT_CHANGE_PASSWORD, {"uid": user_id, "new_hash": new_hashed_password}
+        )
         await self.db.commit()
+        return result.rowcount == 1
@@ -4,15 +4,15 @@ This module provides routes for user authentication and authorization, including
 registration, login, token refresh, and logout functionalities.
 """
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, status, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, status, Request, BackgroundTasks, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_db
+from src.core.depend_service import get_auth_service
+from src.jobs.email_queue import enqueue_email
 from src.services.auth import AuthService, oauth2_scheme
-from src.services.email import send_email
 from src.schemas.token import TokenResponse, RefreshTokenRequest
 from src.schemas.user import UserResponse, UserCreate
 
@@ -20,18 +20,6 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 logger = logging.getLogger("uvicorn.error")
 
 
-def get_auth_service(db: AsyncSession = Depends(get_db)):
-    """Get an instance of the AuthService.
-
-    Args:
-        db (AsyncSession): The database session dependency.
-
-    Returns:
-        AuthService: An instance of the AuthService.
-    """
-    return AuthService(db)
-
-
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
@@ -45,7 +33,7 @@ async def register(
 
     Args:
         user_data (UserCreate): The user data for registration.
-        background_tasks (BackgroundTasks): Background tasks for sending emails.
+        background_tasks (BackgroundTasks): Fallback for sending emails in-process.
         request (Request): The HTTP request object.
         auth_service (AuthService): The authentication service dependency.
 
@@ -53,7 +41,13 @@ async def register(
         UserResponse: The registered user data.
     """
     user = await auth_service.register_user(user_data)
-    background_tasks.add_task(send_email, user.email, user.username, request.base_url)
+    await enqueue_email(
+        background_tasks,
+        "verify",
+        email=user.email,
+        username=user.username,
+        host=str(request.base_url),
+    )
     logger.info("User %s registered successfully", user.username)
     return user
 
@@ -81,7 +75,8 @@ async def login(
         ip_address=request.client.host if request else None,
         user_agent=request.headers.get("user-agent") if request else None,
     )
-    return TokenResponse(
+    # built from trusted values; FastAPI validates it against response_model
+    return TokenResponse.model_construct(
         access_token=access_token, token_type="bearer", refresh_token=refresh_token
     )
 
@@ -113,14 +108,14 @@ async def refresh(
 
     await auth_service.revoke_refresh_token(refresh_token.refresh_token)
 
-    return TokenResponse(
+    return TokenResponse.model_construct(
         access_token=new_access_token,
         token_type="bearer",
         refresh_token=new_refresh_token,
     )
 
 
-@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 async def logout(
     refresh_token: RefreshTokenRequest,
     token: str = Depends(oauth2_scheme),
@@ -134,8 +129,14 @@ async def logout(
         auth_service (AuthService): The authentication service dependency.
 
     Returns:
-        None
+        Response: An empty 204 response.
     """
-    await auth_service.revoke_access_token(token)
-    await auth_service.revoke_refresh_token(refresh_token.refresh_token)
-    return None
+    # reject a bad access token before either revocation starts
+    auth_service.decode_and_validate_access_token(token)
+    # the access token is blacklisted in Redis and the refresh token revoked in
+    # the database, so the two do not share the session and can run together
+    await asyncio.gather(
+        auth_service.revoke_access_token(token),
+        auth_service.revoke_refresh_token(refresh_token.refresh_token),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -3,58 +3,188 @@
 This module provides routes for managing user contacts, including creating,
 retrieving, updating, deleting, and searching contacts, as well as retrieving
 upcoming birthdays.
+
+Read-only routes close their session as soon as the data is loaded, so the
+pooled connection is returned before the response is serialized. Write
+routes keep the session open for the whole request.
+
+Responses are serialized with orjson through `ORJSONResponse`. List routes
+return it built from plain dictionaries; the `response_model` is kept for the
+OpenAPI schema only and is not validated.
+
+The contact list and detail reads carry an `ETag` and must be revalidated by
+the client. The tag is derived from a cheap version query (the count, highest
+ID and latest `updated_at` of the user's contacts, or one contact's
+`updated_at`), so a matching `If-None-Match` gets a 304 before the contacts
+are loaded or serialized. The same version selects the cached body, so the
+body served under a tag always belongs to that version.
 """
 
+import hashlib
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.depend_service import get_current_user
+from src.conf.config import settings
+from src.core.depend_service import get_contacts_service, get_current_user
+from src.core.rate_limit import limiter
 from src.database.db import get_db
-from src.entity.models import User
 from src.services.contacts import ContactsService
 from src.schemas.contacts import BaseContact, UpdateContact, ContactResponse
+from src.schemas.user import CurrentUser
 
 
-router = APIRouter(prefix="/contacts", tags=["contacts"])
+router = APIRouter(
+    prefix="/contacts", tags=["contacts"], default_response_class=ORJSONResponse
+)
 logger = logging.getLogger("uvicorn.error")
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def next_cursor_headers(contacts: list[dict], limit: int) -> dict[str, str]:
+    """Builds the headers exposing the cursor of the next page.
+
+    The header is only set when the page is full, i.e. when more contacts
+    may follow.
+
+    Args:
+        contacts (list[dict]): The contacts of the current page.
+        limit (int): The requested page size.
+
+    Returns:
+        dict[str, str]: The headers to add to the response.
+    """
+    if len(contacts) == limit:
+        return {NEXT_CURSOR_HEADER: str(contacts[-1]["id"])}
+    return {}
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    """Builds the caching headers of a revalidated read.
+
+    The cached data behind these routes is dropped on every write, so
+    clients may keep the body but must revalidate it (`no-cache`).
+
+    Args:
+        etag (str): The ETag of the response.
+
+    Returns:
+        dict[str, str]: The `ETag` and `Cache-Control` headers.
+    """
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def make_etag(*parts) -> str:
+    """Builds a weak ETag from the values that identify a response version.
+
+    Args:
+        *parts: The values the response depends on.
+
+    Returns:
+        str: The weak ETag.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Answers a conditional request whose copy is still current.
+
+    Args:
+        request (Request): The HTTP request, checked for `If-None-Match`.
+        etag (str): The ETag of the current version.
+
+    Returns:
+        Response | None: An empty 304 response if `If-None-Match` holds the
+        ETag, otherwise None.
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag)
+        )
+    return None
+
+
+def etag_response(
+    content, etag: str, headers: dict[str, str] | None = None
+) -> Response:
+    """Serializes a read response together with its ETag.
+
+    Args:
+        content: The JSON-serializable response content.
+        etag (str): The ETag of the version the content was loaded at.
+        headers (dict[str, str] | None): Extra headers to send.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(
+        orjson.dumps(content),
+        media_type="application/json",
+        headers={**(headers or {}), **_etag_headers(etag)},
+    )
+
 
 @router.get("/", response_model=list[ContactResponse])
+@limiter.limit(settings.CONTACTS_RATE_LIMIT)
 async def get_contacts(
+    request: Request,
     limit: int = Query(10, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: int | None = Query(None, ge=0),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Retrieve a list of contacts for the current user.
 
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+
     Args:
+        request (Request): The HTTP request object, used for rate limiting.
         limit (int): The maximum number of contacts to retrieve.
-        offset (int): The number of contacts to skip.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        cursor (int | None): The ID of the last contact of the previous page.
+        db (AsyncSession): The database session dependency, closed once the
+            data is loaded.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         list[ContactResponse]: A list of contacts.
     """
-    contacts_service = ContactsService(db)
-    return await contacts_service.get_contacts(limit, offset, user)
+    # the version is read before the page, so a write in between can only
+    # cost the client one extra full response, never a stale 304
+    version = await contacts_service.get_contacts_version(user)
+    etag = make_etag(user.id, request.url.query, *version)
+    if (response := not_modified(request, etag)) is not None:
+        await db.close()
+        return response
+    contacts = await contacts_service.get_contacts(limit, cursor, user, version)
+    await db.close()
+    return etag_response(contacts, etag, next_cursor_headers(contacts, limit))
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
+    request: Request,
     contact_id: int,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Retrieve a specific contact by ID.
 
     Args:
+        request (Request): The HTTP request object.
         contact_id (int): The ID of the contact to retrieve.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        db (AsyncSession): The database session dependency, closed once the
+            data is loaded.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         ContactResponse: The contact details.
@@ -62,50 +192,58 @@ async def get_contact(
     Raises:
         HTTPException: If the contact is not found.
     """
-    contacts_service = ContactsService(db)
-    contact = await contacts_service.ge_contact_by_id(contact_id, user)
+    updated_at = await contacts_service.get_contact_version(contact_id, user)
+    contact = None
+    if updated_at is not None:
+        etag = make_etag(user.id, contact_id, updated_at)
+        if (response := not_modified(request, etag)) is not None:
+            await db.close()
+            return response
+        contact = await contacts_service.ge_contact_by_id(
+            contact_id, user, (updated_at,)
+        )
+    await db.close()
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found",
         )
-    return contact
+    return etag_response(contact.model_dump(), etag)
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     body: BaseContact,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Create a new contact for the current user.
 
     Args:
         body (BaseContact): The contact data to create.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         ContactResponse: The created contact details.
     """
-    contact_service = ContactsService(db)
-    return await contact_service.create_contact(body, user)
+    return await contacts_service.create_contact(body, user)
 
 
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     contact_id: int,
     body: UpdateContact,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Update an existing contact for the current user.
 
     Args:
         contact_id (int): The ID of the contact to update.
         body (UpdateContact): The updated contact data.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         ContactResponse: The updated contact details.
@@ -113,8 +251,7 @@ async def update_contact(
     Raises:
         HTTPException: If the contact is not found.
     """
-    contact_secvice = ContactsService(db)
-    contact = await contact_secvice.update_contact(contact_id, body, user)
+    contact = await contacts_service.update_contact(contact_id, body, user)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -126,21 +263,20 @@ async def update_contact(
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Delete a contact for the current user.
 
     Args:
         contact_id (int): The ID of the contact to delete.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         None
     """
-    contact_secvice = ContactsService(db)
-    await contact_secvice.remove_contact(contact_id, user)
+    await contacts_service.remove_contact(contact_id, user)
     return None
 
 
@@ -148,41 +284,51 @@ async def delete_contact(
 async def search_contacts(
     query: str,
     limit: int = Query(10, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: int | None = Query(None, ge=0),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Search for contacts by a query string.
 
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+
     Args:
         query (str): The search query string.
         limit (int): The maximum number of contacts to retrieve.
-        offset (int): The number of contacts to skip.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        cursor (int | None): The ID of the last contact of the previous page.
+        db (AsyncSession): The database session dependency, closed once the
+            data is loaded.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         list[ContactResponse]: A list of matching contacts.
     """
-    contact_secvice = ContactsService(db)
-    return await contact_secvice.search_contacts(query, limit, offset, user)
+    contacts = await contacts_service.search_contacts(query, limit, cursor, user)
+    await db.close()
+    return ORJSONResponse(contacts, headers=next_cursor_headers(contacts, limit))
 
 
 @router.get("/upcoming_birthdays/", response_model=list[ContactResponse])
 async def get_upcoming_birthdays(
     days_ahead: int = Query(7, ge=1, le=31),
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    contacts_service: ContactsService = Depends(get_contacts_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
     """Retrieve contacts with upcoming birthdays within a specified number of days.
 
     Args:
         days_ahead (int): The number of days ahead to check for birthdays.
-        db (AsyncSession): The database session dependency.
-        user (User): The current authenticated user.
+        db (AsyncSession): The database session dependency, closed once the
+            data is loaded.
+        contacts_service (ContactsService): The contacts service dependency.
+        user (CurrentUser): The current authenticated user.
 
     Returns:
         list[ContactResponse]: A list of contacts with upcoming birthdays.
     """
-    contact_secvice = ContactsService(db)
-    return await contact_secvice.get_upcoming_birthdays(user, days_ahead)
+    contacts = await contacts_service.get_upcoming_birthdays(user, days_ahead)
+    await db.close()
+    return ORJSONResponse(contacts)
@@ -15,30 +15,29 @@ from fastapi import (
     File,
     UploadFile,
 )
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
 
 from src.conf.config import settings
 from src.core.email_token import get_email_from_token
-from src.core.reset_token import create_reset_token
+from src.core.rate_limit import limiter
 from src.core.depend_service import (
     get_auth_service,
     get_user_service,
     get_current_user,
     get_current_admin_user,
 )
-from src.entity.models import User
-from src.schemas.user import UserResponse
+from src.jobs.email_queue import enqueue_email
+from src.schemas.user import CurrentUser, UserResponse
 from src.schemas.email import RequestEmail
 from src.schemas.password import ResetPasswordRequest
 from src.services.auth import AuthService, oauth2_scheme
 from src.services.upload_file import UploadFileService
 from src.services.user import UserService
-from src.services.email import send_email, send_reset_password_email
 
 
-router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
+router = APIRouter(
+    prefix="/users", tags=["users"], default_response_class=ORJSONResponse
+)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -78,12 +77,15 @@ async def confirmed_email(
         HTTPException: If the token is invalid or the user is not found.
     """
     email = get_email_from_token(token)
+    if await user_service.is_email_confirmed_cached(email):
+        return {"message": "Email already confirmed"}
     user = await user_service.get_user_by_email(email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification failed"
         )
     if user.confirmed:
+        await user_service.cache_email_confirmed(email)
         return {"message": "Email already confirmed"}
     await user_service.confirmed_email(email)
     return {"message": "Email confirmed successfully"}
@@ -100,43 +102,52 @@ async def request_email(
 
     Args:
         body (RequestEmail): The email request payload.
-        background_tasks (BackgroundTasks): Background tasks for sending emails.
+        background_tasks (BackgroundTasks): Fallback for sending emails in-process.
         request (Request): The HTTP request object.
         user_service (UserService): The user service dependency.
 
     Returns:
         dict: A message indicating the email request status.
     """
+    if await user_service.is_email_confirmed_cached(body.email):
+        return {"message": "Email already confirmed"}
     user = await user_service.get_user_by_email(body.email)
 
+    if user is None:
+        return {"message": "Wrong email, please check your email"}
     if user.confirmed:
+        await user_service.cache_email_confirmed(body.email)
         return {"message": "Email already confirmed"}
-    if user:
-        background_tasks.add_task(
-            send_email, body.email, user.username, request.base_url
-        )
-        return {"message": "Confirmation email sent"}
+    await enqueue_email(
+        background_tasks,
+        "verify",
+        email=body.email,
+        username=user.username,
+        host=str(request.base_url),
+    )
+    return {"message": "Confirmation email sent"}
 
 
 @router.patch("/avatar", response_model=UserResponse)
 async def update_user_avatar(
     file: UploadFile = File(),
-    user: User = Depends(get_current_admin_user),
+    user: CurrentUser = Depends(get_current_admin_user),
     user_service: UserService = Depends(get_user_service),
 ):
     """Update the avatar of the current user.
 
     Args:
         file (UploadFile): The uploaded avatar file.
-        user (User): The current authenticated admin user.
+        user (CurrentUser): The current authenticated admin user.
         user_service (UserService): The user service dependency.
 
     Returns:
         UserResponse: The updated user details with the new avatar URL.
     """
-    avatar_url = UploadFileService(
+    upload_service = UploadFileService(
         settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    )
+    avatar_url = await upload_service.upload_file_async(file, user.username)
 
     user = await user_service.update_avatar_url(user.email, avatar_url)
     return user
@@ -153,7 +164,7 @@ async def request_reset_password(
 
     Args:
         body (RequestEmail): The email request payload.
-        background_tasks (BackgroundTasks): Background tasks for sending emails.
+        background_tasks (BackgroundTasks): Fallback for sending emails in-process.
         request (Request): The HTTP request object.
         user_service (UserService): The user service dependency.
 
@@ -166,14 +177,15 @@ async def request_reset_password(
         return {"message": "Wrong email, please check your email"}
 
     if user:
-        token = create_reset_token({"sub": user.email})
-        await user_service.save_token_to_redis(user.email, token)
-        background_tasks.add_task(
-            send_reset_password_email,
-            body.email,
-            user.username,
-            request.base_url,
-            token,
+        # the token is minted by whoever sends the email, so it is never
+        # queued in Redis in plaintext
+        await enqueue_email(
+            background_tasks,
+            "reset_password",
+            email=body.email,
+            username=user.username,
+            host=str(request.base_url),
+            user_id=user.id,
         )
         return {"message": "Reset password email sent"}
 
@@ -183,7 +195,7 @@ async def reset_password(
     token: str,
     body: ResetPasswordRequest,
     user_service: UserService = Depends(get_user_service),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Reset a user's password using a token.
 
@@ -191,7 +203,7 @@ async def reset_password(
         token (str): The password reset token.
         body (ResetPasswordRequest): The new password payload.
         user_service (UserService): The user service dependency.
-        current_user (User): The current authenticated user.
+        current_user (CurrentUser): The current authenticated user.
 
     Returns:
         dict: A message indicating the password reset status.
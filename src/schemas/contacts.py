@@ -2,40 +2,36 @@
 
 This module defines Pydantic models for creating, updating, and responding with contact data.
 It includes validation rules and optional fields for flexibility.
+The length limits of each field are declared once as annotated types and shared by all schemas.
 """
 
 from datetime import date
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.conf import constants
 
 
+FirstName = Annotated[str, Field(max_length=constants.MAX_LENGTH_FIRST_NAME)]
+LastName = Annotated[str, Field(max_length=constants.MAX_LENGTH_LAST_NAME)]
+ContactEmail = Annotated[str, Field(max_length=constants.MAX_LENGTH_EMAIL)]
+Phone = Annotated[str, Field(max_length=constants.MAX_LENGTH_PHONE)]
+OptionalData = Annotated[str, Field(max_length=constants.MAX_LENGTH_OPTIONAL_DATA)]
+
+
 class BaseContact(BaseModel):
     """Base schema for contact data.
 
     Defines common fields and validation rules for contact-related operations.
     """
 
-    first_name: str = Field(
-        max_length=constants.MAX_LENGTH_FIRST_NAME,
-    )
-    last_name: str = Field(
-        max_length=constants.MAX_LENGTH_LAST_NAME,
-    )
-    email: str = Field(
-        max_length=constants.MAX_LENGTH_EMAIL,
-    )
-    phone: str = Field(
-        max_length=constants.MAX_LENGTH_PHONE,
-        default=None,
-    )
+    first_name: FirstName
+    last_name: LastName
+    email: ContactEmail
+    phone: Phone = None
     birthday: date
-    optional_data: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_OPTIONAL_DATA,
-        default=None,
-    )
+    optional_data: Optional[OptionalData] = None
 
 
 class CreateContact(BaseContact):
@@ -53,27 +49,12 @@ class UpdateContact(BaseContact):
     Inherits from BaseContact but makes all fields optional to allow partial updates.
     """
 
-    first_name: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_FIRST_NAME,
-        default=None,
-    )
-    last_name: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_LAST_NAME,
-        default=None,
-    )
-    email: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_EMAIL,
-        default=None,
-    )
-    phone: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_PHONE,
-        default=None,
-    )
-    birthday: Optional[date] = Field(default=None)
-    optional_data: Optional[str] = Field(
-        max_length=constants.MAX_LENGTH_OPTIONAL_DATA,
-        default=None,
-    )
+    first_name: Optional[FirstName] = None
+    last_name: Optional[LastName] = None
+    email: Optional[ContactEmail] = None
+    phone: Optional[Phone] = None
+    birthday: Optional[date] = None
+    optional_data: Optional[OptionalData] = None
 
 
 class ContactResponse(BaseContact):
@@ -1,8 +1,26 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 
 from src.entity.models import UserRole
 
 
+@dataclass(slots=True)
+class CurrentUser:
+    """The authenticated user of a request.
+
+    A plain object built from the cached user fields, so resolving the
+    current user does not set up SQLAlchemy instance state.
+    """
+
+    id: int
+    username: str
+    email: str
+    avatar: str | None
+    role: UserRole
+    confirmed: bool
+
+
 class UserBase(BaseModel):
     username: str = Field(min_length=2, max_length=50, description="Username")
     email: EmailStr
@@ -5,13 +5,13 @@ It includes methods for creating and validating access and refresh tokens, as we
 """
 
 from datetime import datetime, timedelta, timezone
-import json
 import secrets
+import time
 
 import jwt
-import bcrypt
+import orjson
 import hashlib
-import redis.asyncio as redis
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,14 +19,18 @@ from redis.exceptions import ConnectionError
 from libgravatar import Gravatar
 
 from src.conf.config import settings
-from src.entity.models import User
+from src.core.jwt_cache import decode_cached
+from src.core.jwt_encode import encode_token
+from src.database.redis import redis_client
+from src.entity.models import User, UserRole
 from src.repositories.refresh_token_repository import RefreshTokenRepository
 from src.repositories.user_repository import UserRepository
-from src.schemas.user import UserCreate
-from src.utils.hash_password import hash_password
+from src.schemas.user import CurrentUser, UserCreate
+from src.utils.hash_password import hash_password_async, verify_password_async
 
-redis_client = redis.from_url(settings.REDIS_URL)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+# token hash -> (user fields, exp) for tokens recently seen as not revoked
+_local_users: TTLCache = TTLCache(maxsize=10_000, ttl=settings.AUTH_LOCAL_CACHE_TTL)
 
 
 class AuthService:
@@ -42,9 +46,13 @@ class AuthService:
         self.user_repository = UserRepository(db)
         self.refresh_token_repository = RefreshTokenRepository(db)
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def _verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
         """Verify if a plain password matches a hashed password.
 
+        bcrypt runs on a worker thread so the event loop is not blocked.
+
         Args:
             plain_password (str): The plain text password.
             hashed_password (str): The hashed password.
@@ -52,18 +60,18 @@ class AuthService:
         Returns:
             bool: True if the passwords match, False otherwise.
         """
-        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        return await verify_password_async(plain_password, hashed_password)
 
-    def _hash_token(self, token: str):
+    def _hash_token(self, token: str) -> bytes:
         """Hash a token using SHA-256.
 
         Args:
             token (str): The token to hash.
 
         Returns:
-            str: The hashed token.
+            bytes: The raw 32-byte digest of the token.
         """
-        return hashlib.sha256(token.encode()).hexdigest()
+        return hashlib.sha256(token.encode()).digest()
 
     async def authenticate(self, username: str, password: str) -> User:
         """Authenticate a user by username and password.
@@ -91,7 +99,7 @@ class AuthService:
                 detail="Email not confirmed",
             )
 
-        if not self._verify_password(password, user.hash_password):
+        if not await self._verify_password(password, user.hash_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -110,11 +118,14 @@ class AuthService:
         Raises:
             HTTPException: If the username or email already exists.
         """
-        if await self.user_repository.get_by_username(user_data.username):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, detail="User already exists"
-            )
-        if await self.user_repository.get_user_by_email(user_data.email):
+        existing = await self.user_repository.get_by_username_or_email(
+            user_data.username, user_data.email
+        )
+        if existing is not None:
+            if existing.username == user_data.username:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail="User already exists"
+                )
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
             )
@@ -124,7 +135,7 @@ class AuthService:
             avatar = g.get_image()
         except Exception as e:
             print(f"Error generating Gravatar: {e}")
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         user = await self.user_repository.create_user(
             user_data, hashed_password, avatar
         )
@@ -139,13 +150,10 @@ class AuthService:
         Returns:
             str: The generated access token.
         """
-        expires_delts = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        expires = datetime.now(timezone.utc) + expires_delts
+        expires = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
         to_encode = {"sub": username, "exp": expires}
-        encoded_jwt = jwt.encode(
-            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-        )
+        encoded_jwt = encode_token(to_encode)
         return encoded_jwt
 
     async def create_refresh_token(
@@ -171,35 +179,53 @@ class AuthService:
         )
         return token
 
-    async def get_current_user(self, token: str = Depends(oauth2_scheme)) -> User:
+    async def get_current_user(
+        self, token: str = Depends(oauth2_scheme)
+    ) -> CurrentUser:
         """Get the current user based on the provided token.
 
+        The user is cached in Redis under the token hash until the token
+        expires, so a cache hit skips decoding the token. Each process also
+        keeps the user for `settings.AUTH_LOCAL_CACHE_TTL` seconds, so a
+        revocation made elsewhere can take that long to be seen.
+
         Args:
             token (str): The access token.
 
         Returns:
-            User: The current user.
+            CurrentUser: The current user.
 
         Raises:
             HTTPException: If the token is invalid or revoked.
         """
+        token_hash = self._hash_token(token).hex()
+        local = _local_users.get(token_hash)
+        if local is not None and local[1] > time.time():
+            return CurrentUser(**local[0])
+
+        cache_key = f"user:token:{token_hash}"
+        # the blacklist check and the user lookup share one round trip
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.exists(f"bl:{token_hash}")
+        pipe.get(cache_key)
         try:
-            if await redis_client.exists(f"bl:{token}") > 0:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token has been revoked",
-                )
+            revoked, cached_user = await pipe.execute()
         except ConnectionError:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Redis connection error",
             )
-
-        cache_key = f"user:{token}"
-        cached_user = await redis_client.get(cache_key)
+        if revoked > 0:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+            )
         if cached_user:
-            user_dict = json.loads(cached_user)
-            return User(**user_dict)
+            user_dict = orjson.loads(cached_user)
+            exp = user_dict.pop("exp")
+            user_dict["role"] = UserRole(user_dict["role"])
+            _local_users[token_hash] = (user_dict, exp)
+            return CurrentUser(**user_dict)
 
         payload = self.decode_and_validate_access_token(token)
         username = payload.get("sub")
@@ -208,6 +234,7 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
             )
+
         user = await self.user_repository.get_by_username(username)
         if user is None:
             raise HTTPException(
@@ -215,16 +242,44 @@ class AuthService:
                 detail="Could not validate credentials",
             )
 
+        exp = int(payload["exp"])
         user_dict = {
             "id": user.id,
             "username": user.username,
             "email": user.email,
             "avatar": user.avatar,
             "role": user.role,
+            "confirmed": user.confirmed,
+            "exp": exp,
         }
-        await redis_client.setex(cache_key, 3600, json.dumps(user_dict))
+        ttl = max(1, exp - int(time.time()))
+        # the per-user index lets invalidate_cached_user find every cached token
+        index_key = f"user:tokens:{username}"
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.setex(cache_key, ttl, orjson.dumps(user_dict))
+        pipe.sadd(index_key, token_hash)
+        pipe.expire(index_key, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+        await pipe.execute()
+        del user_dict["exp"]
+        _local_users[token_hash] = (user_dict, exp)
+
+        return CurrentUser(**user_dict)
+
+    async def invalidate_cached_user(self, username: str) -> None:
+        """Remove a cached user so the next request reloads it from the database.
 
-        return user
+        Args:
+            username (str): The username of the cached user.
+
+        Returns:
+            None
+        """
+        index_key = f"user:tokens:{username}"
+        token_hashes = [h.decode() for h in await redis_client.smembers(index_key)]
+        for token_hash in token_hashes:
+            _local_users.pop(token_hash, None)
+        keys = [f"user:token:{h}" for h in token_hashes]
+        await redis_client.delete(index_key, *keys)
 
     def decode_and_validate_access_token(self, token: str) -> dict:
         """Decode and validate an access token.
@@ -239,9 +294,7 @@ class AuthService:
             HTTPException: If the token is invalid.
         """
         try:
-            payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
+            payload = decode_cached(token)
             return payload
         except jwt.PyJWTError:
             raise HTTPException(
@@ -269,7 +322,7 @@ class AuthService:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
             )
-        user = await self.user_repository.get_by_id(refresh_token.user_id)
+        user = refresh_token.user
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
@@ -287,11 +340,7 @@ class AuthService:
             None
         """
         token_hash = self._hash_token(token)
-        refresh_token = await self.refresh_token_repository.get_by_token_hash(
-            token_hash
-        )
-        if refresh_token and not refresh_token.revoked_at:
-            await self.refresh_token_repository.revoke_token(refresh_token)
+        await self.refresh_token_repository.revoke_by_hash(token_hash)
         return None
 
     async def revoke_access_token(self, token: str) -> None:
@@ -306,7 +355,11 @@ class AuthService:
         payload = self.decode_and_validate_access_token(token)
         exp = payload.get("exp")
         if exp:
+            token_hash = self._hash_token(token).hex()
+            _local_users.pop(token_hash, None)
             await redis_client.setex(
-                f"bl:{token}", int(exp - datetime.now(timezone.utc).timestamp()), "1"
+                f"bl:{token_hash}",
+                int(exp - time.time()),
+                "1",
             )
         return None
@@ -0,0 +1,67 @@
+"""
+Redis-backed cache for per-user read models.
+
+Each user's cached entries live in a single Redis hash, so all of them can be
+invalidated with one DEL when the user's data changes. Cache failures are
+logged and treated as misses; the caller then falls back to the database.
+
+Functions:
+    get_cached: Reads a field from a cached hash.
+    set_cached: Stores a field in a cached hash and refreshes its TTL.
+    invalidate: Drops every cached field of a hash.
+"""
+
+import logging
+
+from redis.exceptions import RedisError
+
+from src.database.redis import redis_client
+
+logger = logging.getLogger("uvicorn.error")
+
+
+async def get_cached(key: str, field: str) -> bytes | None:
+    """Reads a field from a cached hash.
+
+    Args:
+        key (str): The Redis key of the hash.
+        field (str): The field to read.
+
+    Returns:
+        bytes | None: The cached value, or None on a miss or a Redis error.
+    """
+    try:
+        return await redis_client.hget(key, field)
+    except RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+async def set_cached(key: str, field: str, value: str | bytes, ttl: int) -> None:
+    """Stores a field in a cached hash and refreshes the hash TTL.
+
+    Args:
+        key (str): The Redis key of the hash.
+        field (str): The field to store.
+        value (str | bytes): The serialized value.
+        ttl (int): Lifetime of the hash in seconds.
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, value)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def invalidate(key: str) -> None:
+    """Drops every cached field of a hash.
+
+    Args:
+        key (str): The Redis key of the hash.
+    """
+    try:
+        await redis_client.delete(key)
+    except RedisError as e:
+        logger.warning("Cache invalidation failed for %s: %s", key, e)
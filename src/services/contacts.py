@@ -2,13 +2,76 @@
 
 This module provides the ContactsService class, which acts as a service layer for managing contacts.
 It interacts with the ContactsRepository to perform CRUD operations and other contact-related functionalities.
+Contact lists and single contacts are cached per user in Redis and invalidated on every write.
+Cache fields include the version the caller's ETag was built from, so a body cached by a read
+that raced a write is never served under the ETag of the newer version.
+Rows loaded from the database are trusted and returned without Pydantic re-validation;
+a single contact read from the cache is validated to restore its field types.
 """
 
+import orjson
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.repositories.contacts_repository import ContactsRepository
 
-from src.entity.models import User
-from src.schemas.contacts import BaseContact, UpdateContact
+from src.conf.config import settings
+from src.entity.models import Contact
+from src.schemas.contacts import BaseContact, UpdateContact, ContactResponse
+from src.schemas.user import CurrentUser
+from src.services import cache
+
+
+def _cache_key(user: CurrentUser) -> str:
+    """Build the Redis key holding the cached contact reads of a user.
+
+    Args:
+        user (CurrentUser): The owner of the contacts.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"contacts:{user.id}"
+
+
+def _cache_field(*parts) -> str:
+    """Build the field of a cached read within a user's cache hash.
+
+    Args:
+        *parts: The read's kind, its parameters and the version of the data.
+
+    Returns:
+        str: The cache field.
+    """
+    return ":".join(map(str, parts))
+
+
+def _row_to_dict(row: Row) -> dict:
+    """Convert a contact row into a JSON-ready dictionary.
+
+    Args:
+        row (Row): A row selected with the contact response columns.
+
+    Returns:
+        dict: The contact fields; orjson serializes the birthday as an ISO date.
+    """
+    return dict(row._mapping)
+
+
+_RESPONSE_FIELDS = tuple(ContactResponse.model_fields)
+
+
+def _to_response(contact: Contact) -> ContactResponse:
+    """Wrap a contact loaded from the database without re-validating it.
+
+    Args:
+        contact (Contact): A contact returned by the repository.
+
+    Returns:
+        ContactResponse: The contact response built with `model_construct`.
+    """
+    return ContactResponse.model_construct(
+        **{name: getattr(contact, name) for name in _RESPONSE_FIELDS}
+    )
 
 
 class ContactsService:
@@ -29,92 +92,164 @@ class ContactsService:
         """
         self.contacts_repository = ContactsRepository(db)
 
-    async def create_contact(self, body: BaseContact, user: User):
+    async def create_contact(self, body: BaseContact, user: CurrentUser):
         """Create a new contact for a user.
 
         Args:
             body (BaseContact): The contact data to create.
-            user (User): The user creating the contact.
+            user (CurrentUser): The user creating the contact.
 
         Returns:
-            The created contact instance.
+            ContactResponse: The created contact.
         """
-        return await self.contacts_repository.create_contact(user, body)
+        contact = await self.contacts_repository.create_contact(user, body)
+        await cache.invalidate(_cache_key(user))
+        return _to_response(contact)
 
-    async def get_contacts(self, limit: int, offset: int, user: User):
+    async def get_contacts(
+        self, limit: int, cursor: int | None, user: CurrentUser, version: tuple = ()
+    ):
         """Retrieve a list of contacts for a user with pagination.
 
         Args:
             limit (int): The maximum number of contacts to retrieve.
-            offset (int): The number of contacts to skip.
-            user (User): The user whose contacts are being retrieved.
+            cursor (int | None): The ID of the last contact of the previous page.
+            user (CurrentUser): The user whose contacts are being retrieved.
+            version (tuple): The version from `get_contacts_version` read
+                before this call; the page is cached under it.
+
+        Returns:
+            list[dict]: A list of JSON-ready contacts.
+        """
+        field = _cache_field("list", limit, cursor, *version)
+        cached = await cache.get_cached(_cache_key(user), field)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        rows = await self.contacts_repository.get_contacts(user, limit, cursor)
+        contacts = [_row_to_dict(row) for row in rows]
+        await cache.set_cached(
+            _cache_key(user), field, orjson.dumps(contacts), settings.CONTACTS_CACHE_TTL
+        )
+        return contacts
+
+    async def get_contacts_version(self, user: CurrentUser) -> tuple:
+        """Retrieve a version of a user's contacts that changes on every write.
+
+        Args:
+            user (CurrentUser): The user whose contacts are versioned.
 
         Returns:
-            A list of contact instances.
+            tuple: The number of contacts, the highest ID and the latest update time.
         """
-        return await self.contacts_repository.get_contacts(user, limit, offset)
+        return await self.contacts_repository.get_contacts_version(user)
+
+    async def get_contact_version(self, contact_id: int, user: CurrentUser):
+        """Retrieve when a contact was last updated.
 
-    async def ge_contact_by_id(self, contact_id: int, user: User):
+        Args:
+            contact_id (int): The ID of the contact.
+            user (CurrentUser): The user who owns the contact.
+
+        Returns:
+            datetime | None: The last update time, or None if the contact is not found.
+        """
+        return await self.contacts_repository.get_contact_version(user, contact_id)
+
+    async def ge_contact_by_id(
+        self, contact_id: int, user: CurrentUser, version: tuple = ()
+    ):
         """Retrieve a contact by its ID for a user.
 
         Args:
             contact_id (int): The ID of the contact to retrieve.
-            user (User): The user whose contact is being retrieved.
+            user (CurrentUser): The user whose contact is being retrieved.
+            version (tuple): The version from `get_contact_version` read
+                before this call; the contact is cached under it.
 
         Returns:
-            The contact instance if found, otherwise None.
+            ContactResponse | None: The contact if found, otherwise None.
         """
-        return await self.contacts_repository.get_contact_by_id(user, contact_id)
+        field = _cache_field("id", contact_id, *version)
+        cached = await cache.get_cached(_cache_key(user), field)
+        if cached is not None:
+            # validated, unlike rows from the database: the cached JSON holds
+            # the birthday as an ISO string, which only validation turns back
+            # into the date the schema promises
+            return ContactResponse.model_validate_json(cached)
+
+        contact = await self.contacts_repository.get_contact_by_id(user, contact_id)
+        if contact is None:
+            return None
+        contact = _to_response(contact)
+        await cache.set_cached(
+            _cache_key(user),
+            field,
+            contact.model_dump_json(),
+            settings.CONTACTS_CACHE_TTL,
+        )
+        return contact
 
-    async def update_contact(self, contact_id: int, body: UpdateContact, user: User):
+    async def update_contact(self, contact_id: int, body: UpdateContact, user: CurrentUser):
         """Update an existing contact for a user.
 
         Args:
             contact_id (int): The ID of the contact to update.
             body (UpdateContact): The updated contact data.
-            user (User): The user updating the contact.
+            user (CurrentUser): The user updating the contact.
 
         Returns:
-            The updated contact instance.
+            ContactResponse | None: The updated contact if found, otherwise None.
         """
-        return await self.contacts_repository.update_contact(user, contact_id, body)
+        contact = await self.contacts_repository.update_contact(user, contact_id, body)
+        if contact is None:
+            return None
+        await cache.invalidate(_cache_key(user))
+        return _to_response(contact)
 
-    async def remove_contact(self, contact_id: int, user: User):
+    async def remove_contact(self, contact_id: int, user: CurrentUser):
         """Remove a contact by its ID for a user.
 
         Args:
             contact_id (int): The ID of the contact to remove.
-            user (User): The user removing the contact.
+            user (CurrentUser): The user removing the contact.
 
         Returns:
-            The removed contact instance if successful, otherwise None.
+            int | None: The ID of the removed contact if successful, otherwise None.
         """
-        return await self.contacts_repository.remove_contact(user, contact_id)
-
-    async def search_contacts(self, query: str, limit: int, offset: int, user: User):
+        deleted_id = await self.contacts_repository.remove_contact(user, contact_id)
+        if deleted_id is not None:
+            await cache.invalidate(_cache_key(user))
+        return deleted_id
+
+    async def search_contacts(
+        self, query: str, limit: int, cursor: int | None, user: CurrentUser
+    ):
         """Search for contacts matching a query for a user.
 
         Args:
             query (str): The search query string.
             limit (int): The maximum number of contacts to retrieve.
-            offset (int): The number of contacts to skip.
-            user (User): The user whose contacts are being searched.
+            cursor (int | None): The ID of the last contact of the previous page.
+            user (CurrentUser): The user whose contacts are being searched.
 
         Returns:
-            A list of contact instances matching the query.
+            list[dict]: A list of JSON-ready contacts matching the query.
         """
-        return await self.contacts_repository.search_contacts(
-            query=query, limit=limit, offset=offset, user=user
+        rows = await self.contacts_repository.search_contacts(
+            query=query, limit=limit, cursor=cursor, user=user
         )
+        return [_row_to_dict(row) for row in rows]
 
-    async def get_upcoming_birthdays(self, user: User, days_ahead: int):
+    async def get_upcoming_birthdays(self, user: CurrentUser, days_ahead: int):
         """Retrieve contacts with upcoming birthdays within a specified number of days.
 
         Args:
-            user (User): The user whose contacts are being checked.
+            user (CurrentUser): The user whose contacts are being checked.
             days_ahead (int): The number of days ahead to check for birthdays.
 
         Returns:
-            A list of contact instances with upcoming birthdays.
+            list[dict]: A list of JSON-ready contacts with upcoming birthdays.
         """
-        return await self.contacts_repository.get_upcoming_birthdays(user, days_ahead)
+        rows = await self.contacts_repository.get_upcoming_birthdays(user, days_ahead)
+        return [_row_to_dict(row) for row in rows]
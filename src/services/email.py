@@ -1,18 +1,43 @@
 """This module provides email-related services using FastAPI-Mail.
 
 The module includes functions to send email for account verification and password reset.
+Templates are compiled once at import and reused for every message.
+Delivery failures are logged and reported to the caller, so queued jobs can be retried.
 """
 
+import logging
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
 
 from src.conf.config import settings
 from src.core.email_token import create_email_token
 
-conf = ConnectionConfig(
+TEMPLATE_FOLDER = Path(__file__).parent.parent / "templates"
+
+# FastMail builds a fresh Environment per message by default, which recompiles
+# the template every time; this one keeps compiled templates for the process
+_template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_FOLDER),
+    autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
+)
+for _name in ("verify_email.html", "reset_password.html"):
+    _template_env.get_template(_name)
+
+
+class _CachedTemplatesConfig(ConnectionConfig):
+    """Connection settings that hand FastMail the shared template environment."""
+
+    def template_engine(self) -> Environment:
+        """Returns the module's precompiled template environment."""
+        return _template_env
+
+
+conf = _CachedTemplatesConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
     MAIL_FROM=settings.MAIL_FROM,
@@ -23,11 +48,13 @@ conf = ConnectionConfig(
     MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
     USE_CREDENTIALS=settings.USE_CREDENTIALS,
     VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent.parent / "templates",
+    TEMPLATE_FOLDER=TEMPLATE_FOLDER,
 )
+fm = FastMail(conf)
+logger = logging.getLogger("uvicorn.error")
 
 
-async def send_email(email: EmailStr, username: str, host: str):
+async def send_email(email: EmailStr, username: str, host: str) -> bool:
     """Send an email for account verification.
 
     Args:
@@ -36,10 +63,8 @@ async def send_email(email: EmailStr, username: str, host: str):
         host (str): The host URL for the verification link.
 
     Returns:
-        None
-
-    Raises:
-        ConnectionErrors: If there is an error connecting to the email server.
+        bool: True if the email was sent, False if the email server could not
+        be reached.
     """
     try:
         token_verification = create_email_token({"sub": email})
@@ -54,15 +79,16 @@ async def send_email(email: EmailStr, username: str, host: str):
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as err:
-        print(err)
+        logger.error("Failed to send email to %s: %s", email, err)
+        return False
+    return True
 
 
 async def send_reset_password_email(
     email: EmailStr, username: str, host: str, token: str
-):
+) -> bool:
     """Send an email for password reset.
 
     Args:
@@ -72,10 +98,8 @@ async def send_reset_password_email(
         token (str): The token for password reset.
 
     Returns:
-        None
-
-    Raises:
-        ConnectionErrors: If there is an error connecting to the email server.
+        bool: True if the email was sent, False if the email server could not
+        be reached.
     """
     try:
         message = MessageSchema(
@@ -89,7 +113,8 @@ async def send_reset_password_email(
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="reset_password.html")
     except ConnectionErrors as err:
-        print(err)
+        logger.error("Failed to send email to %s: %s", email, err)
+        return False
+    return True
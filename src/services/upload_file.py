@@ -1,10 +1,16 @@
 """Module for handling file uploads using Cloudinary.
 
 This module provides a service class `UploadFileService` to configure Cloudinary and upload files to it.
+Uploads can go through the blocking Cloudinary SDK or, from async code, through an `httpx` client that
+streams the file to the Upload API without reading it into memory.
 """
 
 import cloudinary
 import cloudinary.uploader
+import cloudinary.utils
+import httpx
+
+UPLOAD_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
 
 class UploadFileService:
@@ -47,7 +53,51 @@ class UploadFileService:
         """
         public_id = f"RestApp/{username}"
         r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
-        src_url = cloudinary.CloudinaryImage(public_id).build_url(
-            width=250, height=250, crop="fill", version=r.get("version")
+        return UploadFileService._avatar_url(public_id, r.get("version"))
+
+    @staticmethod
+    async def upload_file_async(file, username) -> str:
+        """Streams a file to Cloudinary and returns the URL of the uploaded file.
+
+        The request is signed with the Cloudinary SDK and sent as a multipart
+        body read from `file.file` chunk by chunk.
+
+        Args:
+            file (UploadFile): The file object to be uploaded.
+            username (str): The username to associate with the uploaded file.
+
+        Returns:
+            str: The URL of the uploaded file.
+
+        Raises:
+            httpx.HTTPError: If the upload request fails.
+        """
+        public_id = f"RestApp/{username}"
+        params = cloudinary.utils.sign_request(
+            cloudinary.utils.build_upload_params(public_id=public_id, overwrite=True),
+            {},
+        )
+        url = cloudinary.utils.cloudinary_api_url("upload", resource_type="image")
+        async with httpx.AsyncClient(timeout=UPLOAD_TIMEOUT) as client:
+            response = await client.post(
+                url,
+                data=params,
+                files={"file": (file.filename, file.file, file.content_type)},
+            )
+        response.raise_for_status()
+        return UploadFileService._avatar_url(public_id, response.json().get("version"))
+
+    @staticmethod
+    def _avatar_url(public_id: str, version) -> str:
+        """Builds the URL of the square avatar thumbnail of an uploaded image.
+
+        Args:
+            public_id (str): The Cloudinary public ID of the image.
+            version: The version returned by the upload.
+
+        Returns:
+            str: The avatar URL.
+        """
+        return cloudinary.CloudinaryImage(public_id).build_url(
+            width=250, height=250, crop="fill", version=version
         )
-        return src_url
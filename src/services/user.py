@@ -3,18 +3,25 @@
 This module provides the UserService class, which contains methods for managing user-related operations such as creating users, retrieving user information, updating user avatars, and handling password changes. It also integrates with Redis for token management.
 """
 
+import asyncio
+import logging
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-import redis.asyncio as redis
+from redis.exceptions import RedisError
 from fastapi import HTTPException, status
 
+from src.core.reset_token import reset_key
+from src.database.redis import redis_client
 from src.entity.models import User
+from src.repositories.refresh_token_repository import RefreshTokenRepository
 from src.repositories.user_repository import UserRepository
 from src.schemas.user import UserCreate
 from src.services.auth import AuthService
 from src.conf.config import settings
-from src.utils.hash_password import hash_password
+from src.utils.hash_password import hash_password_async
 
-redis_client = redis.from_url(settings.REDIS_URL)
+logger = logging.getLogger("uvicorn.error")
 
 
 class UserService:
@@ -23,13 +30,15 @@ class UserService:
     Attributes:
         db (AsyncSession): The database session for interacting with the database.
         user_repository (UserRepository): Repository for user-related database operations.
+        refresh_token_repository (RefreshTokenRepository): Repository for refresh tokens.
         auth_service (AuthService): Service for authentication-related operations.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, auth_service: AuthService | None = None):
         self.db = db
         self.user_repository = UserRepository(self.db)
-        self.auth_service = AuthService(db)
+        self.refresh_token_repository = RefreshTokenRepository(self.db)
+        self.auth_service = auth_service or AuthService(db)
 
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user.
@@ -67,14 +76,47 @@ class UserService:
         user = await self.user_repository.get_user_by_email(email)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> bool:
         """Confirm a user's email.
 
         Args:
             email (str): The email to confirm.
+
+        Returns:
+            bool: True if a user with the email was found and confirmed.
         """
-        user = await self.user_repository.confirmed_email(email)
-        return user
+        confirmed = await self.user_repository.confirmed_email(email)
+        if confirmed:
+            await self.cache_email_confirmed(email)
+        return confirmed
+
+    async def is_email_confirmed_cached(self, email: str) -> bool:
+        """Check whether an email is known to be confirmed without a database query.
+
+        Args:
+            email (str): The email to check.
+
+        Returns:
+            bool: True if the email is cached as confirmed, False on a miss or a Redis error.
+        """
+        try:
+            return await redis_client.exists(f"user:conf:{email}") > 0
+        except RedisError as e:
+            logger.warning("Confirmation cache read failed for %s: %s", email, e)
+            return False
+
+    async def cache_email_confirmed(self, email: str) -> None:
+        """Remember that an email is confirmed.
+
+        Args:
+            email (str): The confirmed email.
+        """
+        try:
+            await redis_client.setex(
+                f"user:conf:{email}", settings.EMAIL_CONFIRMED_CACHE_TTL, "1"
+            )
+        except RedisError as e:
+            logger.warning("Confirmation cache write failed for %s: %s", email, e)
 
     async def update_avatar_url(self, email: str, url: str):
         """Update the avatar URL for a user.
@@ -84,13 +126,21 @@ class UserService:
             url (str): The new avatar URL.
 
         Returns:
-            None
+            User: The updated user object.
         """
-        return await self.user_repository.update_avatar_url(email, url)
+        user = await self.user_repository.update_avatar_url(email, url)
+        await self.auth_service.invalidate_cached_user(user.username)
+        return user
 
     async def change_password(self, token: str, new_password: str) -> None:
         """Change a user's password.
 
+        The reset token stores the user's ID and username, so the password is
+        updated by ID without loading the user first. The token is consumed
+        before the new password is hashed, so an invalid token costs no bcrypt
+        work on this unauthenticated route. Every refresh token of the user is
+        revoked, so sessions opened with the old password cannot be renewed.
+
         Args:
             token (str): The reset token.
             new_password (str): The new password to set.
@@ -98,48 +148,40 @@ class UserService:
         Raises:
             HTTPException: If the token is invalid or expired, or if the user is not found.
         """
-        email = await self.get_email_from_redis(token)
-        if not email:
+        reset = await self.pop_reset_from_redis(token)
+        if reset is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid or expired token",
             )
-        user = await self.user_repository.get_user_by_email(email)
-        if not user:
+
+        new_hashed_password = await hash_password_async(new_password)
+        if not await self.user_repository.change_password(
+            reset["id"], new_hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
+        await asyncio.gather(
+            self.refresh_token_repository.revoke_for_user(reset["id"]),
+            self.auth_service.invalidate_cached_user(reset["username"]),
+        )
 
-        new_hashed_password = hash_password(new_password)
-        await self.user_repository.change_password(email, new_hashed_password)
-        await self.delete_token_from_redis(token)
-
-    async def save_token_to_redis(self, email: str, token: str) -> None:
-        """Save a reset token to Redis.
-
-        Args:
-            email (str): The email associated with the token.
-            token (str): The reset token.
-        """
-        await redis_client.setex(f"reset_token:{token}", 900, email)
+    async def pop_reset_from_redis(self, token: str) -> dict | None:
+        """Retrieve the user a reset token was issued for and consume the token.
 
-    async def get_email_from_redis(self, token: str) -> str | None:
-        """Retrieve an email from Redis using a token.
+        The read and the delete are a single GETDEL, so a token can only be
+        used once even when two requests race for it.
 
         Args:
             token (str): The reset token.
 
         Returns:
-            str | None: The email if found, otherwise None.
-        """
-        email = await redis_client.get(f"reset_token:{token}")
-        return email.decode() if email else None
-
-    async def delete_token_from_redis(self, token: str) -> None:
-        """Delete a reset token from Redis.
-
-        Args:
-            token (str): The reset token to delete.
+            dict | None: The user's ``id`` and ``username`` if the token is
+            valid, otherwise None.
         """
-        await redis_client.delete(f"reset_token:{token}")
+        reset = await redis_client.getdel(reset_key(token))
+        if not reset:
+            return None
+        return orjson.loads(reset)
@@ -1,20 +1,65 @@
 """Utility module for password hashing.
 
 This module provides functionality to securely hash passwords using the bcrypt library.
+The async helpers run bcrypt on a dedicated thread pool so the event loop keeps serving
+requests and bcrypt jobs do not occupy the loop's default executor.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from src.conf.config import settings
+
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+"""The bcrypt work factor used for new password hashes."""
+
+_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
 
-def hash_password(password: str) -> str:
+
+def hash_password(password: str, rounds: int | None = None) -> str:
     """Hash a plaintext password using bcrypt.
 
     Args:
         password (str): The plaintext password to hash.
+        rounds (int | None): The bcrypt work factor, `BCRYPT_ROUNDS` if omitted.
 
     Returns:
         str: The hashed password as a string.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(password.encode(), salt)
     return hashed_password.decode()
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a plaintext password using bcrypt on the bcrypt thread pool.
+
+    Args:
+        password (str): The plaintext password to hash.
+
+    Returns:
+        str: The hashed password as a string.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Check a plaintext password against a bcrypt hash on the bcrypt thread pool.
+
+    Args:
+        plain_password (str): The plaintext password.
+        hashed_password (str): The stored bcrypt hash.
+
+    Returns:
+        bool: True if the password matches the hash.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+    )
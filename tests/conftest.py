@@ -7,20 +7,32 @@ authentication tokens for testing purposes.
 """
 
 import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-import pytest_asyncio
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# read when the settings are built on import of the app, so it has to be set
+# first: passwords registered and verified through the API then cost bcrypt's
+# minimum work factor instead of the production one
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 from main import app
 from src.entity.models import Base, User, UserRole
 from src.database.db import get_db
+from src.jobs import email_queue
+from src.services import auth
 from src.services.auth import AuthService
 from src.utils.hash_password import hash_password
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# StaticPool keeps the single connection, and with it the in-memory database,
+# alive for the whole session
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -38,6 +50,12 @@ test_user = {
     "password": "123456",
     "role": "ADMIN",
 }
+# hashed once per session at bcrypt's minimum cost; tests do not need a slow hash.
+# PRECOMPUTED_TEST_HASH skips even that, but the login tests verify the password,
+# so it must be a real bcrypt hash of test_user["password"]
+TEST_USER_HASH = os.environ.get("PRECOMPUTED_TEST_HASH") or hash_password(
+    test_user["password"], rounds=4
+)
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -46,7 +64,8 @@ def init_models_wrap():
     Initializes the database models for testing.
 
     This fixture sets up the database by dropping all existing tables and
-    recreating them. It also adds a test user to the database.
+    recreating them. It also inserts a test user with a Core INSERT, which
+    skips the ORM unit of work.
 
     Yields:
         None
@@ -56,32 +75,97 @@ def init_models_wrap():
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
-        async with TestingSessionLocal() as session:
-            hash_pass = hash_password(test_user["password"])
-            current_user = User(
-                username=test_user["username"],
-                email=test_user["email"],
-                hash_password=hash_pass,
-                confirmed=True,
-                avatar="https://twitter.com/gravatar",
-                role=UserRole.ADMIN,
+            await conn.execute(
+                insert(User),
+                [
+                    {
+                        "username": test_user["username"],
+                        "email": test_user["email"],
+                        "hash_password": TEST_USER_HASH,
+                        "confirmed": True,
+                        "avatar": "https://twitter.com/gravatar",
+                        "role": UserRole.ADMIN,
+                    }
+                ],
             )
-            session.add(current_user)
-            await session.commit()
 
     asyncio.run(init_models())
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(autouse=True)
+def clear_local_auth_cache():
+    """Clears the per-process authenticated user cache before each test."""
+    auth._local_users.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def email_queue_mock():
+    """
+    Keeps every test away from the email queue and the SMTP server.
+
+    Routes queue emails on the Redis list of `src.jobs.email_queue`; the queue's
+    client is replaced for the whole session, and so are the in-process
+    senders it falls back to, so no test opens a Redis or SMTP connection.
+
+    Yields:
+        AsyncMock: The patched Redis client of the email queue.
+    """
+    senders = {
+        "verify": AsyncMock(return_value=True),
+        "reset_password": AsyncMock(return_value=True),
+    }
+    with (
+        patch.object(email_queue, "redis_client", AsyncMock()) as queue,
+        patch.dict(email_queue._SENDERS, senders),
+    ):
+        yield queue
+
+
+@pytest.fixture(autouse=True)
+def redis_mock():
+    """
+    Replaces the shared Redis client for each test.
+
+    `src.database.redis.redis_client` is patched together with every module
+    that imported it by name, so no test reaches the Redis at REDIS_URL. The
+    email queue's client is patched for the whole session by
+    `email_queue_mock`.
+
+    By default no token is revoked, no user, reset token or contact read is
+    cached and no email is known to be confirmed. Tests that need other
+    answers request the fixture and reconfigure it, e.g. with
+    `mock_auth_lookup`.
+
+    Yields:
+        AsyncMock: The patched Redis client.
+    """
+    fake = mock_auth_lookup(AsyncMock())
+    fake.exists.return_value = 0
+    fake.getdel.return_value = None
+    fake.hget.return_value = None
+    fake.smembers.return_value = set()
+    with (
+        patch("src.database.redis.redis_client", fake),
+        patch("src.core.reset_token.redis_client", fake),
+        patch("src.services.auth.redis_client", fake),
+        patch("src.services.user.redis_client", fake),
+        patch("src.services.cache.redis_client", fake),
+    ):
+        yield fake
+
+
+@pytest.fixture(scope="session")
 def client():
     """
-    Provides a FastAPI test client with an overridden database dependency.
+    Provides an async HTTP client for the app with an overridden database dependency.
 
     This fixture overrides the `get_db` dependency of the FastAPI app to use
-    the testing database session.
+    the testing database session. The client is built once per session; each
+    request still opens its own session, so the per-module database reset
+    applies to it as well.
 
     Yields:
-        TestClient: A test client for the FastAPI app.
+        AsyncClient: A client that calls the FastAPI app in-process over ASGI.
     """
 
     async def override_get_db():
@@ -94,21 +178,64 @@ def client():
 
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+    yield AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
 
 
-@pytest_asyncio.fixture()
-async def get_token():
+@pytest.fixture(scope="module")
+def get_token():
     """
-    Generates an access token for the test user.
+    Generates an access token for the test user once per test module.
 
     This fixture uses the `AuthService` to create an access token for the
-    predefined test user.
+    predefined test user. Signing a token does not touch the database, so the
+    session is never opened, and the token outlives any single module.
 
     Returns:
         str: A valid access token for the test user.
     """
-    async with TestingSessionLocal() as session:
-        auth_service = AuthService(session)
-        token = auth_service.create_access_token(test_user["username"])
-    return token
+    auth_service = AuthService(TestingSessionLocal())
+    return auth_service.create_access_token(test_user["username"])
+
+
+def mock_auth_lookup(redis_mock, revoked=0, cached_user=None):
+    """
+    Configures a patched auth Redis client for `get_current_user`.
+
+    The blacklist check and the cached user lookup are sent in one pipeline,
+    so both results are returned by a single `execute()` call.
+
+    Args:
+        redis_mock: The patched `src.services.auth.redis_client`.
+        revoked (int): The result of the blacklist `EXISTS`.
+        cached_user (bytes | None): The cached user payload.
+
+    Returns:
+        The configured Redis mock.
+    """
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[revoked, cached_user])
+    # the contacts cache enters its pipeline with `async with`
+    pipe.__aenter__.return_value = pipe
+    redis_mock.pipeline = MagicMock(return_value=pipe)
+    return redis_mock
+
+
+@pytest.fixture()
+def count_queries():
+    """
+    Records the SQL statements sent to the testing database.
+
+    Tests can assert an upper bound on the number of statements a request
+    issues, which guards against N+1 patterns creeping back in.
+
+    Yields:
+        list[str]: The statements executed while the fixture is active.
+    """
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield queries
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,171 @@
+"""
+Tests for the authenticated user cache of AuthService.
+
+`get_current_user` keeps the user in a per-process cache and in Redis under
+the token hash. These tests check that each layer answers without touching
+the database and that `invalidate_cached_user` clears both layers through the
+`user:tokens:{username}` index.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from conftest import TestingSessionLocal, test_user
+from src.entity.models import UserRole
+from src.services import auth
+from src.services.auth import AuthService
+
+pytestmark = pytest.mark.integration
+
+
+class FakePipeline:
+    """Queues commands and runs them against a FakeRedis on `execute()`."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+
+        return queue
+
+    async def execute(self):
+        results = [await getattr(self.redis, n)(*a) for n, a in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeRedis:
+    """A dict-backed stand-in for the commands the auth cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.pipeline = MagicMock(side_effect=lambda **kwargs: FakePipeline(self))
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member.encode())
+
+    async def expire(self, key, ttl):
+        return key in self.data
+
+    async def smembers(self, key):
+        return self.data.get(key, set())
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Replaces the auth Redis client with a FakeRedis.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        FakeRedis: The fake Redis client.
+    """
+    fake = FakeRedis()
+    monkeypatch.setattr(auth, "redis_client", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_fills_both_caches(fake_redis, get_token, count_queries):
+    """Tests that a cache miss loads the user once and caches it in both layers.
+
+    Args:
+        fake_redis (FakeRedis): The fake Redis client.
+        get_token (str): An access token for the test user.
+        count_queries (list[str]): The SQL statements executed during the test.
+    """
+    async with TestingSessionLocal() as session:
+        auth_service = AuthService(session)
+        user = await auth_service.get_current_user(get_token)
+
+        assert user.username == test_user["username"]
+        assert len(count_queries) == 1
+        token_hash = auth_service._hash_token(get_token).hex()
+        assert token_hash in auth._local_users
+        assert f"user:token:{token_hash}" in fake_redis.data
+        index = fake_redis.data[f"user:tokens:{test_user['username']}"]
+        assert index == {token_hash.encode()}
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_local_cache_hit(fake_redis, get_token, count_queries):
+    """Tests that a local cache hit skips both Redis and the database.
+
+    Args:
+        fake_redis (FakeRedis): The fake Redis client.
+        get_token (str): An access token for the test user.
+        count_queries (list[str]): The SQL statements executed during the test.
+    """
+    async with TestingSessionLocal() as session:
+        auth_service = AuthService(session)
+        await auth_service.get_current_user(get_token)
+        count_queries.clear()
+        fake_redis.pipeline.reset_mock()
+
+        user = await auth_service.get_current_user(get_token)
+
+        assert user.username == test_user["username"]
+        assert count_queries == []
+        fake_redis.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_redis_cache_hit(fake_redis, get_token, count_queries):
+    """Tests that a Redis cache hit skips the database.
+
+    Args:
+        fake_redis (FakeRedis): The fake Redis client.
+        get_token (str): An access token for the test user.
+        count_queries (list[str]): The SQL statements executed during the test.
+    """
+    async with TestingSessionLocal() as session:
+        auth_service = AuthService(session)
+        await auth_service.get_current_user(get_token)
+        auth._local_users.clear()
+        count_queries.clear()
+
+        user = await auth_service.get_current_user(get_token)
+
+        assert user.username == test_user["username"]
+        assert user.role == UserRole.ADMIN
+        assert count_queries == []
+        assert auth._local_users
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cached_user(fake_redis, get_token, count_queries):
+    """Tests that invalidation clears both layers so the user is reloaded.
+
+    Args:
+        fake_redis (FakeRedis): The fake Redis client.
+        get_token (str): An access token for the test user.
+        count_queries (list[str]): The SQL statements executed during the test.
+    """
+    async with TestingSessionLocal() as session:
+        auth_service = AuthService(session)
+        await auth_service.get_current_user(get_token)
+
+        await auth_service.invalidate_cached_user(test_user["username"])
+
+        assert not auth._local_users
+        assert fake_redis.data == {}
+        count_queries.clear()
+        await auth_service.get_current_user(get_token)
+        assert len(count_queries) == 1
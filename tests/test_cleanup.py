@@ -0,0 +1,70 @@
+"""
+Tests for the refresh token cleanup job.
+
+The job runs against the SQLite testing database with a small batch size,
+so both statements have to loop over several batches before they finish.
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, select
+
+from conftest import TestingSessionLocal
+from src.database.db import sessionmanager
+from src.entity.models import RefreshToken
+from src.jobs import cleanup
+
+pytestmark = pytest.mark.integration
+
+
+def _token(n: int, expires_at: datetime, revoked_at: datetime | None = None):
+    """Builds the column values of a refresh token row for the test user.
+
+    Args:
+        n (int): A number that makes the token hash unique.
+        expires_at (datetime): When the token expires.
+        revoked_at (datetime | None): When the token was revoked.
+
+    Returns:
+        dict: The column values of the row.
+    """
+    return {
+        "user_id": 1,
+        "token_hash": hashlib.sha256(f"cleanup-{n}".encode()).digest(),
+        "expires_at": expires_at,
+        "revoked_at": revoked_at,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_tokens(monkeypatch):
+    """Tests that expired and long-revoked tokens are deleted across batches.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(sessionmanager, "_session_maker", TestingSessionLocal)
+    monkeypatch.setattr(cleanup, "CLEANUP_BATCH_SIZE", 2)
+    now = datetime.now(timezone.utc)
+    future = now + timedelta(days=7)
+    rows = (
+        [_token(n, now - timedelta(days=1)) for n in range(5)]
+        + [_token(n, future, now - timedelta(days=8)) for n in range(5, 9)]
+        + [_token(9, future, now - timedelta(days=1)), _token(10, future)]
+    )
+    async with TestingSessionLocal() as session:
+        await session.execute(insert(RefreshToken), rows)
+        await session.commit()
+
+    deleted = await cleanup.cleanup_expired_tokens()
+
+    assert deleted == 9
+    async with TestingSessionLocal() as session:
+        remaining = (await session.execute(select(RefreshToken.token_hash))).all()
+    assert {r.token_hash for r in remaining} == {
+        rows[9]["token_hash"],
+        rows[10]["token_hash"],
+    }
+    assert await cleanup.cleanup_expired_tokens() == 0
@@ -8,7 +8,7 @@ the behavior of the database and repository methods.
 """
 
 from datetime import date
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,9 +41,9 @@ def contacts_repository(mock_session):
     return ContactsRepository(mock_session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_user():
-    """Creates a mock User object.
+    """Creates a mock User object shared by the whole session.
 
     Returns:
         User: A mock User instance.
@@ -72,9 +72,11 @@ def mock_contact(mock_user):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_contacts_list(mock_user):
-    """Creates a list of mock Contact objects.
+    """Creates a list of mock Contact objects shared by the whole session.
+
+    The tests only read these contacts, so they are built once.
 
     Args:
         mock_user (User): The mock user associated with the contacts.
@@ -114,28 +116,63 @@ def mock_contacts_list(mock_user):
 
 
 @pytest.mark.asyncio
-async def test_get_contacts(
-    contacts_repository, mock_session, mock_user, mock_contacts_list
+@pytest.mark.parametrize(
+    "method, args, rows",
+    [
+        ("get_contacts", (10, 0), slice(None)),
+        ("search_contacts", ("Alice",), slice(0, 1)),
+        ("search_contacts", ("alice_johnson@example.com",), slice(0, 1)),
+        ("get_upcoming_birthdays", (7,), slice(2, 3)),
+    ],
+)
+async def test_list_queries(
+    contacts_repository, mock_session, mock_user, mock_contacts_list, method, args, rows
 ):
-    """Tests the get_contacts method of ContactsRepository.
+    """Tests the ContactsRepository methods that return a list of contact rows.
 
     Args:
         contacts_repository (ContactsRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         mock_user (User): The mock user.
         mock_contacts_list (list): A list of mock contacts.
+        method (str): The name of the repository method under test.
+        args (tuple): The arguments passed after the user.
+        rows (slice): The contacts the mocked query returns.
     """
     mock_result = Mock()
-    mock_result.scalars.return_value.all.return_value = mock_contacts_list
+    mock_result.all.return_value = mock_contacts_list[rows]
     mock_session.execute.return_value = mock_result
 
-    result = await contacts_repository.get_contacts(mock_user, 10, 0)
+    result = await getattr(contacts_repository, method)(mock_user, *args)
 
-    assert result == mock_contacts_list
-    assert len(result) == len(mock_contacts_list)
+    assert result == mock_contacts_list[rows]
     mock_session.execute.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_after_cursor(
+    contacts_repository, mock_session, mock_user, mock_contacts_list
+):
+    """Tests keyset pagination in the get_contacts method of ContactsRepository.
+
+    Args:
+        contacts_repository (ContactsRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+        mock_user (User): The mock user.
+        mock_contacts_list (list): A list of mock contacts.
+    """
+    mock_result = Mock()
+    mock_result.all.return_value = mock_contacts_list[1:]
+    mock_session.execute.return_value = mock_result
+
+    result = await contacts_repository.get_contacts(mock_user, 10, cursor=1)
+
+    assert result == mock_contacts_list[1:]
+    query = str(mock_session.execute.call_args[0][0])
+    assert "contacts.id >" in query
+    assert "ORDER BY contacts.id" in query
+
+
 @pytest.mark.asyncio
 async def test_get_contact_by_id(
     contacts_repository, mock_session, mock_user, mock_contact
@@ -176,7 +213,11 @@ async def test_create_contact(contacts_repository, mock_session, mock_user):
         birthday=date(1990, 5, 15),
     )
 
-    mock_session.refresh.side_effect = lambda obj: setattr(obj, "id", contact_id)
+    mock_result = Mock()
+    mock_result.scalar_one.return_value = Contact(
+        id=contact_id, **contact_data.model_dump(), user_id=mock_user.id
+    )
+    mock_session.execute.return_value = mock_result
 
     result = await contacts_repository.create_contact(mock_user, contact_data)
 
@@ -187,10 +228,12 @@ async def test_create_contact(contacts_repository, mock_session, mock_user):
     assert result.email == contact_data.email
     assert result.phone == contact_data.phone
     assert result.birthday == contact_data.birthday
-    assert result.user == mock_user
-    mock_session.add.assert_called_once()
+    assert result.user_id == mock_user.id
+    stmt = mock_session.execute.call_args[0][0]
+    assert str(stmt).startswith("INSERT INTO contacts")
+    assert "RETURNING" in str(stmt)
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -206,15 +249,19 @@ async def test_update_contact(
         mock_contact (Contact): The mock contact.
     """
     update_data = UpdateContact(first_name="UpdatedName")
-    contacts_repository.get_contact_by_id = AsyncMock(return_value=mock_contact)
+    mock_contact.first_name = update_data.first_name
+    mock_result = Mock()
+    mock_result.scalar_one_or_none.return_value = mock_contact
+    mock_session.execute.return_value = mock_result
 
     result = await contacts_repository.update_contact(
         mock_user, mock_contact.id, update_data
     )
 
     assert result.first_name == update_data.first_name
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -229,60 +276,58 @@ async def test_remove_contact(
         mock_user (User): The mock user.
         mock_contact (Contact): The mock contact.
     """
-    contacts_repository.get_contact_by_id = AsyncMock(return_value=mock_contact)
+    mock_result = Mock()
+    mock_result.scalar_one_or_none.return_value = mock_contact.id
+    mock_session.execute.return_value = mock_result
 
     result = await contacts_repository.remove_contact(mock_user, mock_contact.id)
 
-    assert result == mock_contact
-    mock_session.delete.assert_awaited_once()
+    assert result == mock_contact.id
+    stmt = mock_session.execute.call_args[0][0]
+    assert str(stmt).endswith("RETURNING contacts.id")
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_search_contacts(
-    contacts_repository, mock_session, mock_user, mock_contacts_list
+async def test_search_contacts_escapes_wildcards(
+    contacts_repository, mock_session, mock_user
 ):
-    """Tests the search_contacts method of ContactsRepository.
+    """Tests that LIKE wildcards in the search query are matched literally.
 
     Args:
         contacts_repository (ContactsRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         mock_user (User): The mock user.
-        mock_contacts_list (list): A list of mock contacts.
     """
-    query = ["Alice", "alice_johnson@example.com"]
-    mock_result = Mock()
-    mock_result.scalars.return_value.all.return_value = mock_contacts_list[0]
-    mock_session.execute.return_value = mock_result
+    mock_session.execute.return_value = Mock()
 
-    result1 = await contacts_repository.search_contacts(mock_user, query[0])
-    result2 = await contacts_repository.search_contacts(mock_user, query[1])
+    await contacts_repository.search_contacts(mock_user, "50%_off")
 
-    assert result1 == mock_contacts_list[0]
-    assert result2 == mock_contacts_list[0]
-
-    assert mock_session.execute.call_count == 2
+    params = mock_session.execute.call_args[0][1]
+    assert params["pattern"] == "%50\\%\\_off%"
 
 
 @pytest.mark.asyncio
-async def test_get_upcoming_birthdays(
-    contacts_repository, mock_session, mock_user, mock_contacts_list
+async def test_get_upcoming_birthdays_across_new_year(
+    contacts_repository, mock_session, mock_user
 ):
-    """Tests the get_upcoming_birthdays method of ContactsRepository.
+    """Tests that the birthday window wraps around the end of the year.
 
     Args:
         contacts_repository (ContactsRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         mock_user (User): The mock user.
-        mock_contacts_list (list): A list of mock contacts.
     """
     mock_result = Mock()
-    mock_result.scalars.return_value.all.return_value = mock_contacts_list[2]
+    mock_result.all.return_value = []
     mock_session.execute.return_value = mock_result
 
-    result = await contacts_repository.get_upcoming_birthdays(
-        days_ahead=7, user=mock_user
-    )
+    with patch("src.repositories.contacts_repository.date") as mock_date:
+        mock_date.today.return_value = date(2025, 12, 28)
+        await contacts_repository.get_upcoming_birthdays(mock_user, days_ahead=7)
 
-    assert result == mock_contacts_list[2]
-    mock_session.execute.assert_awaited_once()
+    query, params = mock_session.execute.call_args[0]
+    assert "contacts.birthday_mmdd >=" in str(query)
+    assert "contacts.birthday_mmdd <=" in str(query)
+    assert (params["start"], params["end"]) == (1228, 104)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the Redis cache used by ContactsService.
+
+These tests verify that contact reads are served from the cache when
+possible, populate it on a miss, and that writes invalidate it.
+"""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.entity.models import Contact, User
+from src.schemas.contacts import UpdateContact
+from src.services.contacts import ContactsService
+
+CONTACT = {
+    "id": 1,
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john@example.com",
+    "phone": "+380991112233",
+    "birthday": "1990-01-01",
+    "optional_data": None,
+}
+
+
+@pytest.fixture
+def user():
+    """Creates the owner of the contacts.
+
+    Returns:
+        User: A user object.
+    """
+    return User(id=1, username="testuser", email="test@example.com")
+
+
+@pytest.fixture
+def mock_cache():
+    """Patches the cache helpers used by ContactsService.
+
+    Yields:
+        MagicMock: The patched cache module.
+    """
+    with patch("src.services.contacts.cache") as cache:
+        cache.get_cached = AsyncMock(return_value=None)
+        cache.set_cached = AsyncMock()
+        cache.invalidate = AsyncMock()
+        yield cache
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_cache_hit(user, mock_cache):
+    """Tests that a cached contact list is returned without a query.
+
+    Args:
+        user (User): The owner of the contacts.
+        mock_cache (MagicMock): The patched cache module.
+    """
+    mock_cache.get_cached.return_value = json.dumps([CONTACT]).encode()
+    service = ContactsService(AsyncMock())
+    service.contacts_repository.get_contacts = AsyncMock()
+
+    result = await service.get_contacts(10, None, user)
+
+    assert result == [CONTACT]
+    service.contacts_repository.get_contacts.assert_not_awaited()
+    mock_cache.get_cached.assert_awaited_once_with("contacts:1", "list:10:None")
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_write_during_read(user, mock_cache):
+    """Tests that a page cached by a read racing a write is not served later.
+
+    The first read takes its version before a write; the write's
+    invalidation lands before the read caches the old page. A read under
+    the new version must still load the new page.
+
+    Args:
+        user (User): The owner of the contacts.
+        mock_cache (MagicMock): The patched cache module.
+    """
+    store = {}
+
+    async def set_cached(key, field, value, ttl):
+        store[field] = value
+
+    mock_cache.get_cached.side_effect = lambda key, field: store.get(field)
+    mock_cache.set_cached.side_effect = set_cached
+    old_version, new_version = (1, 1, "t1"), (1, 1, "t2")
+    new_contact = {**CONTACT, "first_name": "Jane"}
+    service = ContactsService(AsyncMock())
+
+    async def load_then_write(*args):
+        # the write commits and invalidates while the old page is in flight
+        store.clear()
+        return [SimpleNamespace(_mapping=CONTACT)]
+
+    service.contacts_repository.get_contacts = AsyncMock(side_effect=load_then_write)
+    await service.get_contacts(10, None, user, old_version)
+
+    service.contacts_repository.get_contacts = AsyncMock(
+        return_value=[SimpleNamespace(_mapping=new_contact)]
+    )
+    result = await service.get_contacts(10, None, user, new_version)
+
+    assert result == [new_contact]
+    service.contacts_repository.get_contacts.assert_awaited_once()
+    assert set(store) == {"list:10:None:1:1:t1", "list:10:None:1:1:t2"}
+
+
+@pytest.mark.asyncio
+async def test_get_contact_cache_miss(user, mock_cache):
+    """Tests that a contact loaded from the database is cached.
+
+    Args:
+        user (User): The owner of the contacts.
+        mock_cache (MagicMock): The patched cache module.
+    """
+    contact = Contact(**{**CONTACT, "birthday": date(1990, 1, 1)})
+    service = ContactsService(AsyncMock())
+    service.contacts_repository.get_contact_by_id = AsyncMock(return_value=contact)
+
+    result = await service.ge_contact_by_id(1, user)
+
+    assert result.email == "john@example.com"
+    key, field, payload, _ = mock_cache.set_cached.await_args[0]
+    assert (key, field) == ("contacts:1", "id:1")
+    assert json.loads(payload) == CONTACT
+
+
+@pytest.mark.asyncio
+async def test_get_contact_cache_hit(user, mock_cache):
+    """Tests that a cached contact is returned with its schema types restored.
+
+    Args:
+        user (User): The owner of the contacts.
+        mock_cache (MagicMock): The patched cache module.
+    """
+    mock_cache.get_cached.return_value = json.dumps(CONTACT).encode()
+    service = ContactsService(AsyncMock())
+    service.contacts_repository.get_contact_by_id = AsyncMock()
+
+    result = await service.ge_contact_by_id(1, user)
+
+    assert result.birthday == date(1990, 1, 1)
+    service.contacts_repository.get_contact_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_contact_invalidates_cache(user, mock_cache):
+    """Tests that updating a contact drops the user's cached reads.
+
+    Args:
+        user (User): The owner of the contacts.
+        mock_cache (MagicMock): The patched cache module.
+    """
+    service = ContactsService(AsyncMock())
+    service.contacts_repository.update_contact = AsyncMock(return_value=Contact())
+
+    await service.update_contact(1, UpdateContact(first_name="Jane"), user)
+
+    mock_cache.invalidate.assert_awaited_once_with("contacts:1")
@@ -0,0 +1,64 @@
+"""
+Unit tests for the database pool prewarm of DatabaseSessionManager.
+
+The engine is replaced with a mock whose `connect()` fails for one of the
+connections, so the tests can check that the others are still returned to
+the pool.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.database.db import DatabaseSessionManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def manager():
+    """Creates a DatabaseSessionManager whose engine is a mock.
+
+    Returns:
+        DatabaseSessionManager: The manager under test.
+    """
+    manager = DatabaseSessionManager("sqlite+aiosqlite:///prewarm.db")
+    manager._engine = MagicMock()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_prewarm(manager):
+    """Tests that every prewarmed connection is checked and closed.
+
+    Args:
+        manager (DatabaseSessionManager): The manager under test.
+    """
+    conns = [AsyncMock(), AsyncMock()]
+    manager._engine.connect = AsyncMock(side_effect=conns)
+
+    await manager.prewarm(2)
+
+    for conn in conns:
+        conn.execute.assert_awaited_once()
+        conn.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connect_fails(manager):
+    """Tests that a failed connect closes the connections that did open.
+
+    Args:
+        manager (DatabaseSessionManager): The manager under test.
+    """
+    conns = [AsyncMock(), AsyncMock()]
+    error = OSError("connection refused")
+    manager._engine.connect = AsyncMock(side_effect=[conns[0], error, conns[1]])
+
+    with pytest.raises(OSError) as exc:
+        await manager.prewarm(3)
+
+    assert exc.value is error
+    for conn in conns:
+        conn.execute.assert_not_awaited()
+        conn.close.assert_awaited_once()
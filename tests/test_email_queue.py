@@ -0,0 +1,221 @@
+"""
+Unit tests for the Redis-backed email queue.
+
+These tests verify that email jobs are queued as JSON, sent in-process when
+Redis is unavailable, requeued when delivery fails, dead-lettered once they
+run out of attempts, and recovered from the processing list.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.core.reset_token import reset_key
+from src.jobs import email_queue
+from src.jobs.email_queue import (
+    EMAIL_DEAD_KEY,
+    EMAIL_PROCESSING_KEY,
+    EMAIL_QUEUE_KEY,
+    MAX_ATTEMPTS,
+)
+
+KWARGS = {"email": "test@example.com", "username": "test", "host": "http://t/"}
+
+
+@pytest.fixture
+def mock_redis():
+    """Patches the Redis client used by the email queue.
+
+    Yields:
+        AsyncMock: The patched Redis client.
+    """
+    with patch.object(email_queue, "redis_client", AsyncMock()) as redis:
+        yield redis
+
+
+@pytest.fixture
+def mock_sender():
+    """Replaces the verification email sender.
+
+    Yields:
+        AsyncMock: The patched send function.
+    """
+    sender = AsyncMock(return_value=True)
+    with patch.dict(email_queue._SENDERS, {"verify": sender}):
+        yield sender
+
+
+@pytest.mark.asyncio
+async def test_enqueue_email(mock_redis):
+    """Tests that a job is pushed onto the queue as JSON.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+    """
+    background_tasks = MagicMock()
+
+    await email_queue.enqueue_email(background_tasks, "verify", **KWARGS)
+
+    key, job = mock_redis.lpush.await_args[0]
+    assert key == EMAIL_QUEUE_KEY
+    assert orjson.loads(job) == {"kind": "verify", "kwargs": KWARGS, "attempts": 0}
+    background_tasks.add_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_email_without_redis(mock_redis, mock_sender):
+    """Tests that the email is sent in-process when Redis is down.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+        mock_sender (AsyncMock): The patched send function.
+    """
+    mock_redis.lpush.side_effect = ConnectionError()
+    background_tasks = MagicMock()
+
+    await email_queue.enqueue_email(background_tasks, "verify", **KWARGS)
+
+    background_tasks.add_task.assert_called_once_with(mock_sender, **KWARGS)
+
+
+@pytest.mark.asyncio
+async def test_process_next_sends_email(mock_redis, mock_sender):
+    """Tests that a queued job is delivered and not requeued.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+        mock_sender (AsyncMock): The patched send function.
+    """
+    raw = orjson.dumps({"kind": "verify", "kwargs": KWARGS, "attempts": 0})
+    mock_redis.blmove.return_value = raw
+
+    assert await email_queue.process_next() is True
+
+    mock_sender.assert_awaited_once_with(**KWARGS)
+    mock_redis.lpush.assert_not_awaited()
+    mock_redis.blmove.assert_awaited_once_with(
+        EMAIL_QUEUE_KEY, EMAIL_PROCESSING_KEY, 5, "RIGHT", "LEFT"
+    )
+    mock_redis.lrem.assert_awaited_once_with(EMAIL_PROCESSING_KEY, 1, raw)
+
+
+@pytest.mark.asyncio
+async def test_process_next_requeues_failed_email(mock_redis, mock_sender):
+    """Tests that a failed delivery is requeued until MAX_ATTEMPTS.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+        mock_sender (AsyncMock): The patched send function.
+    """
+    mock_sender.return_value = False
+    job = {"kind": "verify", "kwargs": KWARGS, "attempts": 0}
+    mock_redis.blmove.return_value = orjson.dumps(job)
+
+    await email_queue.process_next()
+
+    key, requeued = mock_redis.lpush.await_args[0]
+    assert key == EMAIL_QUEUE_KEY
+    assert orjson.loads(requeued)["attempts"] == 1
+
+    mock_redis.lpush.reset_mock()
+    job["attempts"] = MAX_ATTEMPTS - 1
+    mock_redis.blmove.return_value = orjson.dumps(job)
+
+    await email_queue.process_next()
+
+    key, dead = mock_redis.lpush.await_args[0]
+    assert key == EMAIL_DEAD_KEY
+    assert orjson.loads(dead)["attempts"] == MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_process_next_sender_raises(mock_redis, mock_sender):
+    """Tests that an exception from the sender is a failed attempt.
+
+    The job is requeued and taken off the processing list instead of being
+    lost with the worker.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+        mock_sender (AsyncMock): The patched send function.
+    """
+    mock_sender.side_effect = ValueError("template error")
+    raw = orjson.dumps({"kind": "verify", "kwargs": KWARGS, "attempts": 0})
+    mock_redis.blmove.return_value = raw
+
+    assert await email_queue.process_next() is True
+
+    key, requeued = mock_redis.lpush.await_args[0]
+    assert key == EMAIL_QUEUE_KEY
+    assert orjson.loads(requeued)["attempts"] == 1
+    mock_redis.lrem.assert_awaited_once_with(EMAIL_PROCESSING_KEY, 1, raw)
+
+
+@pytest.mark.asyncio
+async def test_process_next_malformed_job(mock_redis):
+    """Tests that a job that cannot be decoded is dead-lettered.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+    """
+    mock_redis.blmove.return_value = b"not json"
+
+    assert await email_queue.process_next() is True
+
+    mock_redis.lpush.assert_awaited_once_with(EMAIL_DEAD_KEY, b"not json")
+    mock_redis.lrem.assert_awaited_once_with(EMAIL_PROCESSING_KEY, 1, b"not json")
+
+
+@pytest.mark.asyncio
+async def test_requeue_unfinished(mock_redis):
+    """Tests that jobs left on the processing list go back on the queue.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+    """
+    mock_redis.lmove.side_effect = [b"job1", b"job2", None]
+
+    assert await email_queue.requeue_unfinished() == 2
+
+    mock_redis.lmove.assert_awaited_with(
+        EMAIL_PROCESSING_KEY, EMAIL_QUEUE_KEY, "LEFT", "RIGHT"
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_next_empty_queue(mock_redis):
+    """Tests that an empty queue is reported after the timeout.
+
+    Args:
+        mock_redis (AsyncMock): The patched Redis client.
+    """
+    mock_redis.blmove.return_value = None
+
+    assert await email_queue.process_next(timeout=1) is False
+
+
+@pytest.mark.asyncio
+async def test_send_reset_password_issues_token(redis_mock):
+    """Tests that the reset token is created only when the email is sent.
+
+    The job holds the user ID; the sender mints the token, records its user
+    under the token's digest and mails the token itself.
+
+    Args:
+        redis_mock (AsyncMock): The patched shared Redis client.
+    """
+    with patch(
+        "src.jobs.email_queue.send_reset_password_email",
+        AsyncMock(return_value=True),
+    ) as sender:
+        sent = await email_queue._send_reset_password(
+            "test@example.com", "test", "http://t/", 1
+        )
+
+    assert sent is True
+    token = sender.await_args[0][3]
+    key, _, reset = redis_mock.setex.await_args[0]
+    assert key == reset_key(token)
+    assert orjson.loads(reset) == {"id": 1, "username": "test"}
@@ -5,13 +5,13 @@ registration, login, token refresh, and logout functionality. It uses pytest
 for testing and mocks external dependencies like email sending and Redis.
 """
 
-from unittest.mock import Mock, AsyncMock, patch
-
+import orjson
 import pytest
-from sqlalchemy import select
 
-from src.entity.models import User
-from tests.conftest import TestingSessionLocal
+from conftest import test_user
+from src.jobs.email_queue import EMAIL_QUEUE_KEY
+
+pytestmark = pytest.mark.integration
 
 
 user_data = {
@@ -21,23 +21,23 @@ user_data = {
     "role": "USER",
 }
 
+# the user seeded by conftest is created confirmed, so the login tests need no
+# setup of their own; the user registered above stays unconfirmed
+login_data = {"username": test_user["username"], "password": test_user["password"]}
+
 
 @pytest.mark.asyncio
-async def test_register(client, monkeypatch):
+async def test_register(client, email_queue_mock):
     """Test user registration.
 
     Args:
         client: The test client for making HTTP requests.
-        monkeypatch: Pytest fixture for modifying or mocking objects.
+        email_queue_mock: The patched Redis client of the email queue.
 
-    This test verifies that a user can register successfully and that an email
-    is sent during the registration process.
+    This test verifies that a user can register successfully and that a
+    verification email is queued during the registration process.
     """
-    mock_send_email = AsyncMock()
-    monkeypatch.setattr("src.services.email.send_email", mock_send_email)
-
-    response = client.post("/api/v1/auth/register", json=user_data)
-    await mock_send_email("test@example.com", "testuser", "http://testserver/")
+    response = await client.post("/api/v1/auth/register", json=user_data)
 
     assert response.status_code == 201, response.text
     data = response.json()
@@ -46,53 +46,51 @@ async def test_register(client, monkeypatch):
     assert "hash_password" not in data
     assert "id" in data
 
-    mock_send_email.assert_called_once_with(
-        "test@example.com", "testuser", "http://testserver/"
-    )
-    mock_send_email.assert_called_once()
+    key, job = email_queue_mock.lpush.await_args[0]
+    assert key == EMAIL_QUEUE_KEY
+    job = orjson.loads(job)
+    assert job["kind"] == "verify"
+    assert job["kwargs"]["email"] == user_data["email"]
 
 
-def test_repeat_register_username(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_repeat_register_username(client):
     """Test registration with an already existing username.
 
     Args:
         client: The test client for making HTTP requests.
-        monkeypatch: Pytest fixture for modifying or mocking objects.
 
     This test ensures that attempting to register with a duplicate username
     results in a conflict error.
     """
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.services.email.send_email", mock_send_email)
     user_copy = user_data.copy()
     user_copy["email"] = "kot_leapold@gmail.com"
-    response = client.post("api/v1/auth/register", json=user_copy)
+    response = await client.post("api/v1/auth/register", json=user_copy)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "User already exists"
 
 
-def test_repeat_register_email(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_repeat_register_email(client):
     """Test registration with an already existing email.
 
     Args:
         client: The test client for making HTTP requests.
-        monkeypatch: Pytest fixture for modifying or mocking objects.
 
     This test ensures that attempting to register with a duplicate email
     results in a conflict error.
     """
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.services.email.send_email", mock_send_email)
     user_copy = user_data.copy()
     user_copy["username"] = "kot_leapold"
-    response = client.post("api/v1/auth/register", json=user_copy)
+    response = await client.post("api/v1/auth/register", json=user_copy)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "Email already exists"
 
 
-def test_not_confirmed_login(client):
+@pytest.mark.asyncio
+async def test_not_confirmed_login(client):
     """Test login attempt with an unconfirmed email.
 
     Args:
@@ -100,7 +98,7 @@ def test_not_confirmed_login(client):
 
     This test verifies that a user cannot log in without confirming their email.
     """
-    response = client.post(
+    response = await client.post(
         "api/v1/auth/login",
         data={
             "username": user_data.get("username"),
@@ -119,24 +117,9 @@ async def test_login(client):
     Args:
         client: The test client for making HTTP requests.
 
-    This test ensures that a user can log in successfully after confirming their email.
+    This test ensures that a user with a confirmed email can log in successfully.
     """
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
-
-    response = client.post(
-        "api/v1/auth/login",
-        data={
-            "username": user_data.get("username"),
-            "password": user_data.get("password"),
-        },
-    )
+    response = await client.post("api/v1/auth/login", data=login_data)
     assert response.status_code == 200, response.text
     data = response.json()
     assert "access_token" in data
@@ -145,57 +128,47 @@ async def test_login(client):
     assert data["token_type"] == "bearer"
 
 
-def test_wrong_password_login(client):
-    """Test login attempt with an incorrect password.
-
-    Args:
-        client: The test client for making HTTP requests.
-
-    This test verifies that a user cannot log in with a wrong password.
-    """
-    response = client.post(
-        "api/v1/auth/login",
-        data={"username": user_data.get("username"), "password": "password"},
-    )
-    assert response.status_code == 401, response.text
-    data = response.json()
-    assert data["detail"] == "Incorrect username or password"
-
-
-def test_wrong_username_login(client):
-    """Test login attempt with an incorrect username.
-
-    Args:
-        client: The test client for making HTTP requests.
-
-    This test ensures that a user cannot log in with a non-existent username.
-    """
-    response = client.post(
-        "api/v1/auth/login",
-        data={"username": "username", "password": user_data.get("password")},
-    )
-    assert response.status_code == 401, response.text
-    data = response.json()
-    assert data["detail"] == "Incorrect username or password"
-
-
-def test_validation_error_login(client):
-    """Test login attempt with missing required fields.
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "form, status_code, detail",
+    [
+        (
+            {"username": login_data["username"], "password": "password"},
+            401,
+            "Incorrect username or password",
+        ),
+        (
+            {"username": "username", "password": login_data["password"]},
+            401,
+            "Incorrect username or password",
+        ),
+        ({"password": login_data["password"]}, 422, None),
+    ],
+    ids=["wrong_password", "wrong_username", "validation_error"],
+)
+async def test_login_failures(client, form, status_code, detail):
+    """Test login attempts that must be rejected.
 
     Args:
         client: The test client for making HTTP requests.
+        form: The submitted login form.
+        status_code: The expected response status.
+        detail: The expected error detail, or None to only require one.
 
-    This test verifies that login fails when required fields are not provided.
+    This test verifies that a user cannot log in with a wrong password, with a
+    non-existent username, or without the required fields. The wrong password
+    is tried on the seeded user, whose email is confirmed.
     """
-    response = client.post(
-        "api/v1/auth/login", data={"password": user_data.get("password")}
-    )
-    assert response.status_code == 422, response.text
+    response = await client.post("api/v1/auth/login", data=form)
+    assert response.status_code == status_code, response.text
     data = response.json()
     assert "detail" in data
+    if detail is not None:
+        assert data["detail"] == detail
 
 
-def test_refresh_token(client):
+@pytest.mark.asyncio
+async def test_refresh_token(client):
     """Test token refresh functionality.
 
     Args:
@@ -204,16 +177,12 @@ def test_refresh_token(client):
     This test ensures that a new access token and refresh token are issued
     when a valid refresh token is provided.
     """
-    response = client.post(
-        "api/v1/auth/login",
-        data={
-            "username": user_data.get("username"),
-            "password": user_data.get("password"),
-        },
-    )
+    response = await client.post("api/v1/auth/login", data=login_data)
     refresh_token = response.json().get("refresh_token")
 
-    response = client.post("api/v1/auth/refresh", json={"refresh_token": refresh_token})
+    response = await client.post(
+        "api/v1/auth/refresh", json={"refresh_token": refresh_token}
+    )
     assert response.status_code == 200, response.text
     data = response.json()
     assert "access_token" in data
@@ -223,7 +192,27 @@ def test_refresh_token(client):
     assert data["refresh_token"] != refresh_token
 
 
-def test_logout(client):
+@pytest.mark.asyncio
+async def test_refresh_token_query_count(client, count_queries):
+    """Test that refreshing tokens issues a bounded number of SQL statements.
+
+    Args:
+        client: The test client for making HTTP requests.
+        count_queries: The list of SQL statements recorded during the test.
+    """
+    response = await client.post("api/v1/auth/login", data=login_data)
+    refresh_token = response.json().get("refresh_token")
+    count_queries.clear()
+
+    response = await client.post(
+        "api/v1/auth/refresh", json={"refresh_token": refresh_token}
+    )
+    assert response.status_code == 200, response.text
+    assert len(count_queries) <= 4
+
+
+@pytest.mark.asyncio
+async def test_logout(client):
     """Test user logout functionality.
 
     Args:
@@ -232,24 +221,14 @@ def test_logout(client):
     This test verifies that a user can log out successfully and that the
     refresh token is invalidated.
     """
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.setex.return_value = True
-
-        response = client.post(
-            "api/v1/auth/login",
-            data={
-                "username": user_data.get("username"),
-                "password": user_data.get("password"),
-            },
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        access_token = data.get("access_token")
-        refresh_token = data.get("refresh_token")
-        response = client.post(
-            "api/v1/auth/logout",
-            json={"refresh_token": refresh_token},
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        assert response.status_code == 204, response.text
+    response = await client.post("api/v1/auth/login", data=login_data)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    access_token = data.get("access_token")
+    refresh_token = data.get("refresh_token")
+    response = await client.post(
+        "api/v1/auth/logout",
+        json={"refresh_token": refresh_token},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 204, response.text
@@ -1,145 +1,246 @@
-from unittest.mock import patch
-
-
-def test_create_contact(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        contact_data = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john@example.com",
-            "phone": "+380991112233",
-            "birthday": "1990-01-01",
-        }
-
-        response = client.post(
-            "/api/v1/contacts/",
-            json={**contact_data},
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 201, response.text
-        data = response.json()
-        assert data["first_name"] == "John"
-        assert data["email"] == "john@example.com"
-        assert "id" in data
-        assert data["id"] == 1
-
-
-def test_get_contact(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.get(
-            "api/v1/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-
-        assert data["id"] == 1
-
-        assert data["first_name"] == "John"
-
-
-def test_get_contact_not_found(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.get(
-            "/api/v1/contacts/999", headers={"Authorization": f"Bearer {get_token}"}
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Contact not found"
-
-
-def test_get_contacts_list(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.get(
-            "/api/v1/contacts/", headers={"Authorization": f"Bearer {get_token}"}
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert isinstance(data, list)
-        assert data[0]["id"] == 1
-
-
-def test_update_contact(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        update_data = {
-            "first_name": "Updated",
-            "last_name": "Contact",
-            "email": "updated@example.com",
-            "phone": "+380991119999",
-        }
-
-        response = client.put(
-            "/api/v1/contacts/1",
-            json=update_data,
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["first_name"] == "Updated"
-        assert data["email"] == "updated@example.com"
-
-
-def test_update_contact_not_found(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.put(
-            "/api/v1/contacts/999",
-            json={"first_name": "Ghost"},
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Contact not found"
-
-
-def test_delete_contact(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.delete(
-            f"/api/v1/contacts/1",
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 204
-
-
-def test_search_contacts(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.get(
-            "/api/v1/contacts/search/?query=Test",
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-
-
-def test_get_birthdays(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-
-        response = client.get(
-            "/api/v1/contacts/upcoming_birthdays/?days_ahead=7",
-            headers={"Authorization": f"Bearer {get_token}"},
-        )
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, select
+
+from conftest import TestingSessionLocal, test_user
+from src.entity.models import Contact, User
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def seeded_contact():
+    """
+    Inserts the contact the read, update and delete tests work on.
+
+    The row is written with one Core INSERT instead of a POST through the API,
+    so those tests do not depend on `test_create_contact`.
+
+    Returns:
+        int: The ID of the seeded contact.
+    """
+
+    async def seed():
+        async with TestingSessionLocal() as session:
+            result = await session.execute(
+                insert(Contact)
+                .values(
+                    first_name="John",
+                    last_name="Doe",
+                    email="john@example.com",
+                    phone="+380991112233",
+                    birthday=date(1990, 1, 1),
+                    user_id=select(User.id)
+                    .where(User.username == test_user["username"])
+                    .scalar_subquery(),
+                )
+                .returning(Contact.id)
+            )
+            await session.commit()
+            return result.scalar_one()
+
+    return asyncio.run(seed())
+
+
+@pytest.mark.asyncio
+async def test_create_contact(client, get_token):
+    contact_data = {
+        "first_name": "Jane",
+        "last_name": "Roe",
+        "email": "jane@example.com",
+        "phone": "+380991114455",
+        "birthday": "1991-02-02",
+    }
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = await client.post(
+        "/api/v1/contacts/", json={**contact_data}, headers=headers
+    )
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert data["first_name"] == "Jane"
+    assert data["email"] == "jane@example.com"
+    assert "id" in data
+
+    # leave the seeded contact as the only one for the pagination tests
+    response = await client.delete(f"/api/v1/contacts/{data['id']}", headers=headers)
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_get_contact(client, get_token, seeded_contact):
+    response = await client.get(
+        f"api/v1/contacts/{seeded_contact}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+
+    assert data["id"] == seeded_contact
+
+    assert data["first_name"] == "John"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, body", [("GET", None), ("PUT", {"first_name": "Ghost"})]
+)
+async def test_contact_not_found(client, get_token, method, body):
+    response = await client.request(
+        method,
+        "/api/v1/contacts/999",
+        json=body,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Contact not found"
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_list(client, get_token, seeded_contact):
+    response = await client.get(
+        "/api/v1/contacts/", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert isinstance(data, list)
+    assert data[0]["id"] == seeded_contact
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_next_cursor(client, get_token, seeded_contact):
+    response = await client.get(
+        "/api/v1/contacts/?limit=1",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["X-Next-Cursor"] == str(seeded_contact)
+
+    response = await client.get(
+        f"/api/v1/contacts/?limit=1&cursor={seeded_contact}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_contact_not_modified(client, get_token, seeded_contact):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = await client.get(f"/api/v1/contacts/{seeded_contact}", headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    headers["If-None-Match"] = etag
+    response = await client.get(f"/api/v1/contacts/{seeded_contact}", headers=headers)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_not_modified(
+    client, get_token, seeded_contact, count_queries
+):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = await client.get("/api/v1/contacts/", headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    count_queries.clear()
+    response = await client.get(
+        "/api/v1/contacts/", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    # only the version query runs; the page itself is never loaded
+    assert len(count_queries) == 1
+
+    response = await client.post(
+        "/api/v1/contacts/",
+        json={
+            "first_name": "Max",
+            "last_name": "Poe",
+            "email": "max@example.com",
+            "phone": "+380991116677",
+            "birthday": "1992-03-03",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201, response.text
+    created_id = response.json()["id"]
+
+    response = await client.get(
+        "/api/v1/contacts/", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag
+
+    await client.delete(f"/api/v1/contacts/{created_id}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_update_contact(client, get_token, seeded_contact):
+    update_data = {
+        "first_name": "Updated",
+        "last_name": "Contact",
+        "email": "updated@example.com",
+        "phone": "+380991119999",
+    }
+
+    response = await client.put(
+        f"/api/v1/contacts/{seeded_contact}",
+        json=update_data,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["first_name"] == "Updated"
+    assert data["email"] == "updated@example.com"
+
+
+@pytest.mark.asyncio
+async def test_update_contact_query_count(
+    client, get_token, seeded_contact, count_queries
+):
+    response = await client.put(
+        f"/api/v1/contacts/{seeded_contact}",
+        json={"optional_data": "note"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert len(count_queries) <= 2
+
+
+@pytest.mark.asyncio
+async def test_delete_contact(client, get_token, seeded_contact):
+    response = await client.delete(
+        f"/api/v1/contacts/{seeded_contact}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_search_contacts(client, get_token):
+    response = await client.get(
+        "/api/v1/contacts/search/?query=Test",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+
+
+@pytest.mark.asyncio
+async def test_get_birthdays(client, get_token):
+    response = await client.get(
+        "/api/v1/contacts/upcoming_birthdays/?days_ahead=7",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
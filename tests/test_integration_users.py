@@ -1,62 +1,67 @@
-from unittest.mock import patch, Mock, AsyncMock
+from unittest.mock import patch, AsyncMock
 
+import orjson
 import pytest
 
-from conftest import test_user
+from conftest import test_user, mock_auth_lookup
+from src.core.email_token import create_email_token
 
+pytestmark = pytest.mark.integration
 
-def test_me(client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-        token = get_token
-        headers = {"Authorization": f"Bearer {token}"}
-        response = client.get("api/v1/users/me", headers=headers)
-        assert response.status_code == 200
-        data = response.json()
-        assert "email" in data
-        assert "username" in data
-        assert "id" in data
-        assert data["username"] == test_user["username"]
+
+@pytest.mark.asyncio
+async def test_me(client, get_token):
+    token = get_token
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert "email" in data
+    assert "username" in data
+    assert "id" in data
+    assert data["username"] == test_user["username"]
 
 
-@patch("src.services.upload_file.UploadFileService.upload_file")
-def test_update_avatar_user(mock_upload_file, client, get_token):
-    with patch("src.services.auth.redis_client") as redis_mock:
-        redis_mock.exists.return_value = False
-        redis_mock.get.return_value = None
-        fake_url = "http://example.com/avatar.jpg"
-        mock_upload_file.return_value = fake_url
+@pytest.mark.asyncio
+async def test_me_revoked_token(client, get_token, redis_mock):
+    mock_auth_lookup(redis_mock, revoked=1)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = await client.get("api/v1/users/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+@patch(
+    "src.services.upload_file.UploadFileService.upload_file_async",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_update_avatar_user(mock_upload_file, client, get_token):
+    fake_url = "http://example.com/avatar.jpg"
+    mock_upload_file.return_value = fake_url
 
-        headers = {"Authorization": f"Bearer {get_token}"}
+    headers = {"Authorization": f"Bearer {get_token}"}
 
-        file_data = {"file": ("avatar.jpg", b"fake image content", "image/jpeg")}
+    file_data = {"file": ("avatar.jpg", b"fake image content", "image/jpeg")}
 
-        response = client.patch(
-            "/api/v1/users/avatar", headers=headers, files=file_data
-        )
+    response = await client.patch(
+        "/api/v1/users/avatar", headers=headers, files=file_data
+    )
 
-        assert response.status_code == 200, response.text
+    assert response.status_code == 200, response.text
 
-        data = response.json()
-        assert data["username"] == test_user["username"]
-        assert data["email"] == test_user["email"]
-        assert data["avatar"] == fake_url
+    data = response.json()
+    assert data["username"] == test_user["username"]
+    assert data["email"] == test_user["email"]
+    assert data["avatar"] == fake_url
 
-        mock_upload_file.assert_called_once()
+    mock_upload_file.assert_awaited_once()
 
 
-@patch("src.services.user.redis_client")
 @pytest.mark.asyncio
-async def test_request_reset_password(
-    mock_redis_client, client, monkeypatch, get_token
-):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.services.email.send_reset_password_email", mock_send_email)
-    mock_redis_client.setex.return_value = None
-
+async def test_request_reset_password(client, get_token, email_queue_mock):
     email = test_user["email"]
-    response = client.post(
+    response = await client.post(
         "/api/v1/users/request_reset_password",
         json={"email": email},
         headers={"Authorization": f"Bearer {get_token}"},
@@ -66,18 +71,16 @@ async def test_request_reset_password(
     data = response.json()
     assert data["message"] == "Reset password email sent"
 
+    job = orjson.loads(email_queue_mock.lpush.await_args[0][1])
+    assert job["kind"] == "reset_password"
+    assert job["kwargs"]["email"] == email
+    assert "token" not in job["kwargs"]
 
-@patch("src.services.user.redis_client")
-@pytest.mark.asyncio
-async def test_request_reset_password_invalid_email(
-    mock_redis_client, client, monkeypatch, get_token
-):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.services.email.send_reset_password_email", mock_send_email)
-    mock_redis_client.setex.return_value = None
 
+@pytest.mark.asyncio
+async def test_request_reset_password_invalid_email(client, get_token):
     invalid_email = "nonexistent@example.com"
-    response = client.post(
+    response = await client.post(
         "/api/v1/users/request_reset_password",
         json={"email": invalid_email},
         headers={"Authorization": f"Bearer {get_token}"},
@@ -88,25 +91,29 @@ async def test_request_reset_password_invalid_email(
     assert data["message"] == "Wrong email, please check your email"
 
 
-@patch("src.services.user.redis_client")
-@patch("src.services.auth.redis_client")
 @pytest.mark.asyncio
-async def test_reset_password(
-    mock_auth_redis, mock_redis_client, client, monkeypatch, get_token
-):
+async def test_request_email_unknown_email(client, email_queue_mock):
+    email_queue_mock.lpush.reset_mock()
+    response = await client.post(
+        "/api/v1/users/request_email", json={"email": "nonexistent@example.com"}
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["message"] == "Wrong email, please check your email"
+    email_queue_mock.lpush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reset_password(client, monkeypatch, get_token):
     mock_change_password = AsyncMock()
     monkeypatch.setattr(
         "src.services.user.UserService.change_password", mock_change_password
     )
-    mock_auth_redis.exists.return_value = False
-    mock_auth_redis.get.return_value = None
-    mock_redis_client.get.return_value = test_user["email"].encode()
-    mock_redis_client.delete.return_value = True
 
     token = "valid_reset_token"
     new_password = "new_secure_password"
 
-    response = client.patch(
+    response = await client.patch(
         f"/api/v1/users/reset_password/{token}",
         json={"new_password": new_password},
         headers={"Authorization": f"Bearer {get_token}"},
@@ -117,3 +124,17 @@ async def test_reset_password(
     assert data["message"] == "Password changed successfully"
 
     mock_change_password.assert_awaited_once_with(token, new_password)
+
+
+@patch("src.services.user.UserService.get_user_by_email")
+@pytest.mark.asyncio
+async def test_confirmed_email_cached(mock_get_user, client, redis_mock):
+    redis_mock.exists.return_value = 1
+    token = create_email_token({"sub": test_user["email"]})
+
+    response = await client.get(f"/api/v1/users/confirmed_email/{token}")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["message"] == "Email already confirmed"
+    mock_get_user.assert_not_called()
+    redis_mock.exists.assert_awaited_once_with(f"user:conf:{test_user['email']}")
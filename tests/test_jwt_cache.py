@@ -0,0 +1,180 @@
+"""
+Unit tests for the cached JWT decoding helper.
+
+This module contains tests for `decode_cached`, verifying that decoded
+payloads are reused for repeated tokens and match PyJWT, and that invalid
+tokens are rejected without being cached. The HMAC fast path replaces
+PyJWT's verifier, so each of its rejection branches is covered with a
+correctly signed token that is wrong in exactly one way.
+"""
+
+import base64
+import hmac
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import jwt
+import orjson
+import pytest
+
+from src.conf.config import settings
+from src.core import jwt_cache
+from src.core.jwt_cache import decode_cached
+from src.core.jwt_keys import HMAC_DIGESTS, VERIFY_KEY
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clears the decoded token cache before each test."""
+    jwt_cache._cache.clear()
+
+
+def make_token(minutes: int = 5) -> str:
+    """Creates a signed JWT token for the tests.
+
+    Args:
+        minutes (int): Minutes until the token expires.
+
+    Returns:
+        str: The encoded token.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    return jwt.encode(
+        {"sub": "test_user", "exp": expire},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+
+
+def test_decode_cached_reuses_payload():
+    """Tests that a repeated token is decoded only once."""
+    token = make_token()
+
+    with patch(
+        "src.core.jwt_cache._decode", wraps=jwt_cache._decode
+    ) as decode_mock:
+        first = decode_cached(token)
+        second = decode_cached(token)
+
+    assert first["sub"] == "test_user"
+    assert second == first
+    decode_mock.assert_called_once()
+
+
+def test_decode_cached_rejects_invalid_token():
+    """Tests that an invalid token raises and is not cached."""
+    with pytest.raises(jwt.PyJWTError):
+        decode_cached("invalid.token.value")
+
+    assert len(jwt_cache._cache) == 0
+
+
+def test_decode_cached_matches_pyjwt():
+    """Tests that the decoded payload matches PyJWT's result."""
+    token = make_token()
+
+    assert decode_cached(token) == jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        make_token(minutes=-1),
+        make_token().rsplit(".", 1)[0] + "." + "A" * 43,
+        jwt.encode({"sub": "test_user"}, "other-secret", algorithm="HS256"),
+    ],
+    ids=["expired", "tampered", "wrong_key"],
+)
+def test_decode_cached_rejects_bad_token(token):
+    """Tests that expired and badly signed tokens are rejected."""
+    with pytest.raises(jwt.PyJWTError):
+        decode_cached(token)
+
+
+def b64encode(data: bytes) -> bytes:
+    """Encodes bytes as an unpadded base64url segment."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def sign(header, payload) -> str:
+    """Builds a token with a valid signature over arbitrary JSON segments.
+
+    Args:
+        header: The JSON value of the header segment.
+        payload: The JSON value of the payload segment.
+
+    Returns:
+        str: The signed token.
+    """
+    signing_input = (
+        b64encode(orjson.dumps(header)) + b"." + b64encode(orjson.dumps(payload))
+    )
+    digest = hmac.new(VERIFY_KEY, signing_input, HMAC_DIGESTS[settings.ALGORITHM])
+    return (signing_input + b"." + b64encode(digest.digest())).decode()
+
+
+HEADER = {"alg": settings.ALGORITHM, "typ": "JWT"}
+OTHER_ALG = "HS512" if settings.ALGORITHM != "HS512" else "HS256"
+
+
+@pytest.mark.skipif(
+    settings.ALGORITHM not in HMAC_DIGESTS, reason="HMAC fast path not in use"
+)
+@pytest.mark.parametrize(
+    "make, error",
+    [
+        (
+            lambda: sign({**HEADER, "alg": OTHER_ALG}, {"sub": "test_user"}),
+            jwt.InvalidAlgorithmError,
+        ),
+        (
+            lambda: sign({"alg": "none"}, {"sub": "test_user"}).rsplit(".", 1)[0] + ".",
+            jwt.InvalidAlgorithmError,
+        ),
+        (lambda: "only.two", jwt.DecodeError),
+        (lambda: make_token() + ".extra", jwt.DecodeError),
+        (lambda: "a.b.c", jwt.DecodeError),
+        (lambda: sign(HEADER, [1, 2]), jwt.DecodeError),
+        (lambda: sign(["JWT"], {"sub": "test_user"}), jwt.DecodeError),
+        (
+            lambda: sign(HEADER, {"sub": "test_user", "nbf": time.time() + 60}),
+            jwt.ImmatureSignatureError,
+        ),
+        (lambda: sign(HEADER, {"sub": "test_user", "exp": "never"}), jwt.DecodeError),
+    ],
+    ids=[
+        "alg_mismatch",
+        "alg_none",
+        "two_segments",
+        "four_segments",
+        "invalid_base64",
+        "payload_not_object",
+        "header_not_object",
+        "nbf_in_future",
+        "exp_not_number",
+    ],
+)
+def test_decode_hmac_rejects(make, error):
+    """Tests each rejection branch of the HMAC verifier.
+
+    Args:
+        make: Builds the token to reject.
+        error: The PyJWT exception the token must raise.
+    """
+    with pytest.raises(error):
+        decode_cached(make())
+
+    assert len(jwt_cache._cache) == 0
+
+
+@pytest.mark.skipif(
+    settings.ALGORITHM not in HMAC_DIGESTS, reason="HMAC fast path not in use"
+)
+def test_decode_hmac_accepts_past_nbf():
+    """Tests that a token whose nbf has passed is accepted."""
+    payload = {"sub": "test_user", "nbf": int(time.time()) - 60}
+
+    assert decode_cached(sign(HEADER, payload)) == payload
@@ -0,0 +1,36 @@
+"""
+Unit tests for the JWT encoding helper.
+
+This module contains tests for `encode_token`, verifying that its tokens
+match the ones PyJWT produces and decode back to the original claims.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+from src.conf.config import settings
+from src.core.jwt_encode import encode_token
+
+
+def test_encode_token_matches_pyjwt():
+    """Tests that the encoded token is identical to PyJWT's output."""
+    expire = datetime.now(timezone.utc) + timedelta(minutes=5)
+    claims = {"sub": "test_user", "exp": expire}
+
+    assert encode_token(claims) == jwt.encode(
+        claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    )
+
+
+def test_encode_token_round_trip():
+    """Tests that PyJWT decodes the encoded token back to its claims."""
+    now = datetime.now(timezone.utc)
+    token = encode_token(
+        {"sub": "test@example.com", "iat": now, "exp": now + timedelta(days=1)}
+    )
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    assert payload["sub"] == "test@example.com"
+    assert payload["iat"] == int(now.timestamp())
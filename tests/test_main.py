@@ -0,0 +1,79 @@
+"""
+Tests for the routes defined in `main.py`.
+
+The root route is served with a fixed ETag so clients can revalidate it,
+and the healthcheck only queries the database once per throttle window.
+"""
+
+import pytest
+
+import main
+from main import ROOT_BODY, ROOT_HEADERS
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.asyncio
+async def test_read_root(client):
+    """Tests that the root route returns its body with the caching headers.
+
+    Args:
+        client (AsyncClient): The test client.
+    """
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.content == ROOT_BODY
+    assert response.headers["etag"] == ROOT_HEADERS["ETag"]
+    assert response.headers["cache-control"] == ROOT_HEADERS["Cache-Control"]
+
+
+@pytest.mark.asyncio
+async def test_read_root_not_modified(client):
+    """Tests that a matching If-None-Match gets an empty 304.
+
+    Args:
+        client (AsyncClient): The test client.
+    """
+    response = await client.get("/", headers={"If-None-Match": ROOT_HEADERS["ETag"]})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == ROOT_HEADERS["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_read_root_stale_etag(client):
+    """Tests that a different If-None-Match gets the full body.
+
+    Args:
+        client (AsyncClient): The test client.
+    """
+    response = await client.get("/", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.content == ROOT_BODY
+
+
+@pytest.mark.asyncio
+async def test_healthchecker_throttle(client, count_queries, monkeypatch):
+    """Tests that the database is checked once per throttle window.
+
+    Args:
+        client (AsyncClient): The test client.
+        count_queries (list[str]): The SQL statements executed during the test.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(main, "_last_healthcheck_ok", 0.0)
+
+    first = await client.get("/api/healthchecker")
+    second = await client.get("/api/healthchecker")
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == {"message": "Welcome to FastAPI!"}
+    assert second.headers["cache-control"] == "no-store"
+    assert count_queries == ["SELECT 1"]
+
+    monkeypatch.setattr(main, "_last_healthcheck_ok", 0.0)
+    await client.get("/api/healthchecker")
+    assert count_queries == ["SELECT 1", "SELECT 1"]
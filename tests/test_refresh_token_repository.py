@@ -8,7 +8,7 @@ This module contains unit tests for the following methods of the RefreshTokenRep
 - revoke_token: Revokes a refresh token by setting its revoked_at timestamp.
 
 Fixtures:
-    mock_session: Creates a mock AsyncSession for database interactions.
+    mock_session: Creates a stub session for database interactions.
     refresh_token_repository: Creates an instance of RefreshTokenRepository with a mock session.
 """
 
@@ -16,20 +16,31 @@ from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.entity.models import RefreshToken
 from src.repositories.refresh_token_repository import RefreshTokenRepository
 
 
+class _StubSession:
+    """A stand-in for AsyncSession with only the methods the repository awaits."""
+
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+
+
 @pytest.fixture
 def mock_session():
-    """Creates a mock AsyncSession for database interactions.
+    """Creates a stub session for database interactions.
+
+    Building it is cheaper than `AsyncMock(spec=AsyncSession)`, which
+    introspects the whole session class, so each test gets a fresh one.
 
     Returns:
-        AsyncMock: A mock object simulating an AsyncSession.
+        _StubSession: A stub exposing AsyncMock `execute`, `commit` and `refresh`.
     """
-    return AsyncMock(spec=AsyncSession)
+    return _StubSession()
 
 
 @pytest.fixture
@@ -58,7 +69,7 @@ async def test_get_by_token_hash(
         refresh_token_repository (RefreshTokenRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
     """
-    token_hash = "test_token_hash"
+    token_hash = b"test_token_hash"
     mock_token = RefreshToken(token_hash=token_hash)
     mock_result = MagicMock()
     mock_result.scalars.return_value.first.return_value = mock_token
@@ -83,7 +94,7 @@ async def test_get_active_token(
         refresh_token_repository (RefreshTokenRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
     """
-    token_hash = "test_token_hash"
+    token_hash = b"test_token_hash"
     current_time = datetime.now(timezone.utc)
     expires_at = current_time + timedelta(days=1)
     mock_token = RefreshToken(
@@ -113,7 +124,7 @@ async def test_save_token(
         mock_session (AsyncMock): The mock database session.
     """
     user_id = 1
-    token_hash = "test_token_hash"
+    token_hash = b"test_token_hash"
     expires_at = datetime.now(timezone.utc) + timedelta(days=1)
     ip_address = "127.0.0.1"
     user_agent = "TestUserAgent"
@@ -141,16 +152,65 @@ async def test_revoke_token(
 ):
     """Tests the revoke_token method.
 
-    Verifies that the method revokes a refresh token by setting its revoked_at timestamp
-    and that the commit method is called once.
+    Verifies that the method revokes a refresh token with an UPDATE that sets
+    revoked_at to the database time and that the commit method is called once.
 
     Args:
         refresh_token_repository (RefreshTokenRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
     """
-    mock_token = RefreshToken(token_hash="test_token_hash")
+    mock_token = RefreshToken(id=1, token_hash=b"test_token_hash")
 
     await refresh_token_repository.revoke_token(mock_token)
 
-    assert mock_token.revoked_at is not None
+    stmt = str(mock_session.execute.call_args[0][0])
+    assert stmt.startswith("UPDATE refresh_tokens SET revoked_at=now()")
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_revoke_by_hash(
+    refresh_token_repository: RefreshTokenRepository, mock_session: AsyncMock
+):
+    """Tests the revoke_by_hash method.
+
+    Verifies that the method revokes the token with a single UPDATE statement
+    and reports whether a token was revoked.
+
+    Args:
+        refresh_token_repository (RefreshTokenRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+    """
+    mock_result = MagicMock()
+    mock_result.rowcount = 1
+    mock_session.execute.return_value = mock_result
+
+    result = await refresh_token_repository.revoke_by_hash(b"test_token_hash")
+
+    assert result is True
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_revoke_for_user(
+    refresh_token_repository: RefreshTokenRepository, mock_session: AsyncMock
+):
+    """Tests the revoke_for_user method.
+
+    Verifies that all active tokens of a user are revoked with a single UPDATE
+    statement and that the number of revoked tokens is returned.
+
+    Args:
+        refresh_token_repository (RefreshTokenRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+    """
+    mock_result = MagicMock()
+    mock_result.rowcount = 3
+    mock_session.execute.return_value = mock_result
+
+    result = await refresh_token_repository.revoke_for_user(1)
+
+    assert result == 3
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
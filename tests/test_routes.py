@@ -0,0 +1,21 @@
+"""
+Regression tests for the application's route table.
+
+Starlette matches routes by scanning the table in order, so every router
+must be mounted exactly once.
+"""
+
+from collections import Counter
+
+from main import app
+
+
+def test_routes_registered_once():
+    """Tests that no path and method pair is registered twice."""
+    routes = Counter(
+        (route.path, method)
+        for route in app.router.routes
+        for method in getattr(route, "methods", None) or ("*",)
+    )
+
+    assert [key for key, count in routes.items() if count > 1] == []
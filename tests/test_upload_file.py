@@ -0,0 +1,139 @@
+"""
+Tests for the async Cloudinary upload of UploadFileService.
+
+The upload goes through an `httpx.MockTransport`, so these tests inspect the
+signed multipart request the service sends and the URL it builds from the
+Upload API response, without any network access.
+"""
+
+import email
+import functools
+import io
+
+import cloudinary.utils
+import httpx
+import pytest
+
+from src.services import upload_file
+from src.services.upload_file import UploadFileService
+
+pytestmark = pytest.mark.unit
+
+API_SECRET = "test_secret"
+
+
+class _Upload:
+    """A stand-in for the attributes of `UploadFile` the service reads."""
+
+    filename = "avatar.jpg"
+    content_type = "image/jpeg"
+
+    def __init__(self, content: bytes):
+        self.file = io.BytesIO(content)
+
+
+def _form_fields(request: httpx.Request) -> dict:
+    """Parses the multipart body of a request.
+
+    Args:
+        request (httpx.Request): The request sent by the service.
+
+    Returns:
+        dict: The payload of each form field, by field name.
+    """
+    head = f"Content-Type: {request.headers['content-type']}\r\n\r\n".encode()
+    message = email.message_from_bytes(head + request.read())
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(
+            decode=True
+        )
+        for part in message.get_payload()
+    }
+
+
+class _Cloudinary:
+    """Answers upload requests with a canned response and records them."""
+
+    def __init__(self):
+        self.response = httpx.Response(500)
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.response
+
+
+@pytest.fixture
+def mock_cloudinary(monkeypatch):
+    """Routes the service's httpx client to a `_Cloudinary` stand-in.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        _Cloudinary: The stand-in answering the upload requests.
+    """
+    cloudinary_api = _Cloudinary()
+    client = functools.partial(
+        httpx.AsyncClient, transport=httpx.MockTransport(cloudinary_api.handle)
+    )
+    monkeypatch.setattr(upload_file.httpx, "AsyncClient", client)
+    UploadFileService("test_cloud", "test_key", API_SECRET)
+    return cloudinary_api
+
+
+@pytest.mark.asyncio
+async def test_upload_file_async(mock_cloudinary):
+    """Tests that the upload is signed and the avatar URL uses its version.
+
+    Args:
+        mock_cloudinary (_Cloudinary): The Upload API stand-in.
+    """
+    mock_cloudinary.response = httpx.Response(
+        200,
+        json={
+            "version": 1712345678,
+            "secure_url": "https://res.cloudinary.com/test_cloud/image/upload/"
+            "v1712345678/RestApp/testuser.jpg",
+        },
+    )
+
+    url = await UploadFileService.upload_file_async(
+        _Upload(b"fake image content"), "testuser"
+    )
+
+    (request,) = mock_cloudinary.requests
+    assert request.method == "POST"
+    assert str(request.url).endswith("/test_cloud/image/upload")
+    fields = _form_fields(request)
+    assert fields["file"] == b"fake image content"
+    assert fields["public_id"] == b"RestApp/testuser"
+    assert fields["api_key"] == b"test_key"
+    signed = {
+        k: v.decode()
+        for k, v in fields.items()
+        if k not in ("file", "api_key", "signature")
+    }
+    assert fields["signature"].decode() == cloudinary.utils.api_sign_request(
+        signed, API_SECRET
+    )
+    assert url.startswith("https://res.cloudinary.com/test_cloud/image/upload/")
+    assert "/v1712345678/RestApp/testuser" in url
+    assert "c_fill,h_250,w_250" in url
+
+
+@pytest.mark.asyncio
+async def test_upload_file_async_error(mock_cloudinary):
+    """Tests that a rejected upload raises instead of returning a URL.
+
+    Args:
+        mock_cloudinary (_Cloudinary): The Upload API stand-in.
+    """
+    mock_cloudinary.response = httpx.Response(
+        401, json={"error": {"message": "Invalid"}}
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc:
+        await UploadFileService.upload_file_async(_Upload(b"content"), "testuser")
+
+    assert exc.value.response.status_code == 401
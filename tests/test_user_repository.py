@@ -4,30 +4,53 @@ Unit tests for the UserRepository class.
 This module contains tests for the following methods of the UserRepository:
 - get_by_username: Retrieves a user by their username.
 - get_user_by_email: Retrieves a user by their email.
+- get_by_username_or_email: Retrieves a user by their username or email.
 - create_user: Creates a new user in the database.
 - confirmed_email: Confirms a user's email.
 - update_avatar_url: Updates the avatar URL of a user.
 - change_password: Changes the password of a user.
 """
 
+import inspect
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repositories.user_repository import UserRepository
+from src.repositories.user_repository import (
+    _STMT_USER_BY_EMAIL,
+    _STMT_USER_BY_USERNAME,
+    UserRepository,
+)
 from src.schemas.user import UserCreate
 from src.entity.models import User
 
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio(loop_scope="module")]
+
+
+class _StubSession:
+    """A stand-in for AsyncSession with only the methods the repository uses."""
+
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.stream_scalars = AsyncMock()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+        self.add = Mock()
+        self.expunge = Mock()
+
 
 @pytest.fixture
 def mock_session():
-    """Creates a mock AsyncSession for database interactions.
+    """Creates a stub session for database interactions.
+
+    Building it is cheaper than `AsyncMock(spec=AsyncSession)`, which
+    introspects the whole session class, so each test gets a fresh one.
 
     Returns:
-        AsyncMock: A mock object simulating an AsyncSession.
+        _StubSession: A stub exposing the session methods as mocks.
     """
-    return AsyncMock(spec=AsyncSession)
+    return _StubSession()
 
 
 @pytest.fixture
@@ -53,62 +76,110 @@ def test_user():
     return User(id=1, username="testuser", email="test@example.com")
 
 
-@pytest.mark.asyncio
-async def test_get_by_username(user_repository, mock_session, test_user):
-    """Tests the get_by_username method.
+@pytest.fixture
+def scalar_result(test_user):
+    """Creates a query result whose single scalar is the test user.
+
+    Args:
+        test_user (User): The test user object.
 
-    Verifies that the method retrieves the correct user by username
-    and that the database query is executed once.
+    Returns:
+        Mock: A mock result returning the test user from `scalar_one_or_none`.
+    """
+    result = Mock()
+    result.scalar_one_or_none.return_value = test_user
+    return result
+
+
+@pytest.fixture(scope="module")
+def user_create():
+    """Creates the registration data used by the create_user test.
+
+    The schema is validated once per module; tests only read it.
+
+    Returns:
+        UserCreate: The data of the user to create.
+    """
+    return UserCreate(username="newuser", email="new@example.com", password="123456")
+
+
+@pytest.mark.parametrize(
+    "method, arg, stmt, params",
+    [
+        (
+            "get_by_username",
+            "testuser",
+            _STMT_USER_BY_USERNAME,
+            {"username": "testuser"},
+        ),
+        (
+            "get_user_by_email",
+            "test@example.com",
+            _STMT_USER_BY_EMAIL,
+            {"email": "test@example.com"},
+        ),
+    ],
+)
+async def test_get_by(
+    user_repository, mock_session, test_user, scalar_result, method, arg, stmt, params
+):
+    """Tests the UserRepository methods that look a user up by a single value.
+
+    Verifies that the method retrieves the correct user and that the database
+    query is executed once, with the prebuilt statement and the bound value.
 
     Args:
         user_repository (UserRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         test_user (User): The test user object.
+        scalar_result (Mock): The query result returning the test user.
+        method (str): The name of the repository method under test.
+        arg (str): The username or email to look up.
+        stmt (Select): The module-level statement the method must execute.
+        params (dict): The expected bound parameters.
     """
-    mock_result = Mock()
-    mock_result.scalar_one_or_none.return_value = test_user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = scalar_result
 
-    result = await user_repository.get_by_username("testuser")
+    result = await getattr(user_repository, method)(arg)
 
     assert result == test_user
-    mock_session.execute.assert_awaited_once()
+    mock_session.execute.assert_awaited_once_with(stmt, params)
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_email(user_repository, mock_session, test_user):
-    """Tests the get_user_by_email method.
+async def test_get_by_username_or_email(
+    user_repository, mock_session, test_user, scalar_result
+):
+    """Tests the get_by_username_or_email method.
 
-    Verifies that the method retrieves the correct user by email
-    and that the database query is executed once.
+    Verifies that both values are checked with a single database query.
 
     Args:
         user_repository (UserRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         test_user (User): The test user object.
+        scalar_result (Mock): The query result returning the test user.
     """
-    mock_result = Mock()
-    mock_result.scalar_one_or_none.return_value = test_user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = scalar_result
 
-    result = await user_repository.get_user_by_email("test@example.com")
+    result = await user_repository.get_by_username_or_email(
+        "testuser", "other@example.com"
+    )
 
     assert result == test_user
     mock_session.execute.assert_awaited_once()
+    params = mock_session.execute.await_args.args[1]
+    assert params == {"username": "testuser", "email": "other@example.com"}
 
 
-@pytest.mark.asyncio
-async def test_create_user(user_repository):
+async def test_create_user(user_repository, user_create):
     """Tests the create_user method.
 
     Verifies that the method creates a new user and returns the created user.
 
     Args:
         user_repository (UserRepository): The repository instance.
+        user_create (UserCreate): The data of the user to create.
     """
-    user_data = UserCreate(
-        username="newuser", email="new@example.com", password="123456"
-    )
     hash_password = "hashpassword"
     avatar = "avatar_url"
 
@@ -121,38 +192,51 @@ async def test_create_user(user_repository):
 
     user_repository.create = AsyncMock(return_value=mock_user)
 
-    result = await user_repository.create_user(user_data, hash_password, avatar)
+    result = await user_repository.create_user(user_create, hash_password, avatar)
 
     assert result == mock_user
     user_repository.create.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_confirmed_email(user_repository, mock_session, test_user):
-    """Tests the confirmed_email method.
+@pytest.mark.parametrize(
+    "method, args, sql",
+    [
+        ("confirmed_email", ("test@example.com",), "UPDATE users SET confirmed"),
+        (
+            "change_password",
+            (1, "new_hash_password"),
+            "UPDATE users SET hash_password",
+        ),
+    ],
+)
+async def test_single_update(user_repository, mock_session, method, args, sql):
+    """Tests the UserRepository methods that change one column of a user.
 
-    Verifies that the user's email is marked as confirmed and that
-    the database commit is executed.
+    Verifies that the change is made with a single UPDATE statement, that the
+    database commit is executed and that the updated user is reported.
 
     Args:
         user_repository (UserRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
-        test_user (User): The test user object.
+        method (str): The name of the repository method under test.
+        args (tuple): The arguments passed to the method.
+        sql (str): The expected start of the executed statement.
     """
-    user_repository.get_user_by_email = AsyncMock(return_value=test_user)
+    mock_session.execute.return_value = MagicMock(rowcount=1)
 
-    await user_repository.confirmed_email(test_user.email)
+    result = await getattr(user_repository, method)(*args)
 
-    assert test_user.confirmed is True
-    mock_session.commit.assert_called_once()
+    assert result is True
+    stmt = mock_session.execute.call_args[0][0]
+    assert str(stmt).startswith(sql)
+    mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_update_avatar_url(user_repository, mock_session, test_user):
     """Tests the update_avatar_url method.
 
-    Verifies that the user's avatar URL is updated and that
-    the database commit and refresh are executed.
+    Verifies that the user's avatar URL is updated with a single
+    UPDATE ... RETURNING statement and that the database commit is executed.
 
     Args:
         user_repository (UserRepository): The repository instance.
@@ -160,33 +244,103 @@ async def test_update_avatar_url(user_repository, mock_session, test_user):
         test_user (User): The test user object.
     """
     new_avatar_url = "new_avatar_url"
+    test_user.avatar = new_avatar_url
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = test_user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = mock_result
 
-    await user_repository.update_avatar_url(test_user.email, new_avatar_url)
+    result = await user_repository.update_avatar_url(test_user.email, new_avatar_url)
 
-    assert test_user.avatar == new_avatar_url
+    assert result.avatar == new_avatar_url
+    assert "RETURNING" in str(mock_session.execute.call_args[0][0])
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(test_user)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_change_password(user_repository, mock_session, test_user):
-    """Tests the change_password method.
+async def test_get_by_id(user_repository, mock_session, test_user, scalar_result):
+    """Tests the get_by_id method inherited from BaseRepository.
 
-    Verifies that the user's password is updated and that
-    the database commit is executed.
+    Verifies that the cached statement is executed with the requested ID.
 
     Args:
         user_repository (UserRepository): The repository instance.
         mock_session (AsyncMock): The mock database session.
         test_user (User): The test user object.
+        scalar_result (Mock): The query result returning the test user.
     """
-    new_hashed_password = "new_hash_password"
-    user_repository.get_user_by_email = AsyncMock(return_value=test_user)
+    mock_session.execute.return_value = scalar_result
 
-    await user_repository.change_password(test_user.email, new_hashed_password)
+    result = await user_repository.get_by_id(test_user.id)
 
-    assert test_user.hash_password == new_hashed_password
+    assert result == test_user
+    assert mock_session.execute.call_args[0][1] == {"id": test_user.id}
+
+
+async def test_update(user_repository, mock_session, test_user):
+    """Tests the update method inherited from BaseRepository.
+
+    Verifies that pending changes are committed and the instance is
+    refreshed before being returned.
+
+    Args:
+        user_repository (UserRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+        test_user (User): The test user object.
+    """
+    test_user.username = "renamed"
+
+    result = await user_repository.update(test_user)
+
+    assert result is test_user
     mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_awaited_once_with(test_user)
+
+
+async def test_iter_all(user_repository, mock_session, test_user):
+    """Tests the iter_all method inherited from BaseRepository.
+
+    Verifies that records are streamed from a server-side cursor.
+
+    Args:
+        user_repository (UserRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+        test_user (User): The test user object.
+    """
+
+    async def stream():
+        yield test_user
+
+    mock_session.stream_scalars.return_value = stream()
+
+    result = [user async for user in user_repository.iter_all(chunk_size=10)]
+
+    assert result == [test_user]
+    stmt = mock_session.stream_scalars.call_args[0][0]
+    assert stmt.get_execution_options()["yield_per"] == 10
+
+
+async def test_confirmed_email_unknown_user(user_repository, mock_session):
+    """Tests the confirmed_email method for an email without a user.
+
+    Verifies that the method reports the missing user instead of raising.
+
+    Args:
+        user_repository (UserRepository): The repository instance.
+        mock_session (AsyncMock): The mock database session.
+    """
+    mock_session.execute.return_value = MagicMock(rowcount=0)
+
+    result = await user_repository.confirmed_email("missing@example.com")
+
+    assert result is False
+
+
+def test_stub_session_matches_async_session():
+    """Tests that the stub session mirrors the AsyncSession interface.
+
+    Verifies that every stubbed method exists on AsyncSession and is awaitable
+    exactly when the real one is, which `spec=AsyncSession` used to enforce.
+    """
+    for name, method in vars(_StubSession()).items():
+        real = getattr(AsyncSession, name)
+        assert inspect.iscoroutinefunction(real) == isinstance(method, AsyncMock)
@@ -0,0 +1,164 @@
+"""
+Unit tests for the email confirmation and password reset flows of UserService.
+
+These tests verify that only an email that was actually confirmed is
+cached as such, that reset tokens are recorded under their SHA-256 digest,
+that a valid token changes the password exactly once, and that an unknown
+or already used token is rejected without writing anything.
+"""
+
+import hashlib
+from unittest.mock import AsyncMock, patch
+
+import bcrypt
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from src.core.reset_token import issue_reset_token, reset_key
+from src.services.user import UserService
+
+
+@pytest.fixture
+def redis_store(redis_mock):
+    """Backs the patched Redis client's SETEX and GETDEL with a dict.
+
+    Args:
+        redis_mock (AsyncMock): The patched shared Redis client.
+
+    Returns:
+        dict: The stored values by key.
+    """
+    store = {}
+
+    async def setex(key, ttl, value):
+        store[key] = value
+
+    async def getdel(key):
+        return store.pop(key, None)
+
+    redis_mock.setex.side_effect = setex
+    redis_mock.getdel.side_effect = getdel
+    return store
+
+
+@pytest.fixture
+def user_service():
+    """Creates a UserService with its repository and auth service mocked.
+
+    Returns:
+        UserService: The service under test.
+    """
+    service = UserService(AsyncMock(), auth_service=AsyncMock())
+    service.user_repository.change_password = AsyncMock(return_value=True)
+    service.refresh_token_repository.revoke_for_user = AsyncMock(return_value=2)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email(redis_mock, user_service):
+    """Tests that a confirmed email is cached as confirmed.
+
+    Args:
+        redis_mock (AsyncMock): The patched shared Redis client.
+        user_service (UserService): The service under test.
+    """
+    user_service.user_repository.confirmed_email = AsyncMock(return_value=True)
+
+    assert await user_service.confirmed_email("test@example.com") is True
+
+    redis_mock.setex.assert_awaited_once()
+    assert redis_mock.setex.await_args[0][0] == "user:conf:test@example.com"
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_no_user(redis_mock, user_service):
+    """Tests that an email matching no user is not cached as confirmed.
+
+    Args:
+        redis_mock (AsyncMock): The patched shared Redis client.
+        user_service (UserService): The service under test.
+    """
+    user_service.user_repository.confirmed_email = AsyncMock(return_value=False)
+
+    assert await user_service.confirmed_email("missing@example.com") is False
+
+    redis_mock.setex.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_issue_reset_token(redis_store, redis_mock):
+    """Tests that a reset token is stored only as its SHA-256 digest.
+
+    Args:
+        redis_store (dict): The fake Redis data.
+        redis_mock (AsyncMock): The patched shared Redis client.
+    """
+    token = await issue_reset_token(1, "testuser", "test@example.com")
+
+    key = b"reset_token:" + hashlib.sha256(token.encode()).digest()
+    assert reset_key(token) == key
+    assert orjson.loads(redis_store[key]) == {"id": 1, "username": "testuser"}
+    assert redis_mock.setex.await_args[0][1] == 900
+    assert all(token.encode() not in k for k in redis_store)
+
+
+@pytest.mark.asyncio
+async def test_change_password(redis_store, user_service):
+    """Tests that a valid token updates the password and ends the user's sessions.
+
+    Args:
+        redis_store (dict): The fake Redis data.
+        user_service (UserService): The service under test.
+    """
+    token = await issue_reset_token(1, "testuser", "test@example.com")
+
+    await user_service.change_password(token, "new_password")
+
+    user_id, new_hash = user_service.user_repository.change_password.await_args[0]
+    assert user_id == 1
+    assert bcrypt.checkpw(b"new_password", new_hash.encode())
+    user_service.refresh_token_repository.revoke_for_user.assert_awaited_once_with(1)
+    user_service.auth_service.invalidate_cached_user.assert_awaited_once_with(
+        "testuser"
+    )
+    assert redis_store == {}
+
+
+@pytest.mark.asyncio
+async def test_change_password_unknown_token(redis_store, user_service):
+    """Tests that an unknown token is rejected before hashing or writing.
+
+    Args:
+        redis_store (dict): The fake Redis data.
+        user_service (UserService): The service under test.
+    """
+    with (
+        patch("src.services.user.hash_password_async") as hash_password,
+        pytest.raises(HTTPException) as exc,
+    ):
+        await user_service.change_password("unknown", "new_password")
+
+    assert exc.value.status_code == 400
+    hash_password.assert_not_called()
+    user_service.user_repository.change_password.assert_not_awaited()
+    user_service.refresh_token_repository.revoke_for_user.assert_not_awaited()
+    user_service.auth_service.invalidate_cached_user.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_change_password_token_used_once(redis_store, user_service):
+    """Tests that a reset token cannot be used a second time.
+
+    Args:
+        redis_store (dict): The fake Redis data.
+        user_service (UserService): The service under test.
+    """
+    token = await issue_reset_token(1, "testuser", "test@example.com")
+    await user_service.change_password(token, "new_password")
+
+    with pytest.raises(HTTPException) as exc:
+        await user_service.change_password(token, "other_password")
+
+    assert exc.value.status_code == 400
+    user_service.user_repository.change_password.assert_awaited_once()